@@ -5,6 +5,7 @@ from collections import OrderedDict
 from shop.models import ProductVariantModel, ProductStatusType, ProductModel
 from order.models import ShippingMethodModel
 from .storage import BaseStorage
+from .pricing import CartPricingEngine
 from .models import CartItemModel, CartModel
 from core.constants import TaskName, LoggerName
 
@@ -12,9 +13,13 @@ apps_logger = logging.getLogger(LoggerName.APPS)
 
 
 class CartSession:
-    def __init__(self, storage: BaseStorage):
+    def __init__(
+        self, storage: BaseStorage, pricing_engine: CartPricingEngine = None
+    ):
         self.storage = storage
+        self.pricing_engine = pricing_engine or CartPricingEngine()
         self._cart = self.storage.get_container()
+        self._pricing = None
 
         if "items" not in self._cart:
             self._cart["items"] = OrderedDict()
@@ -61,6 +66,7 @@ class CartSession:
             new_quantity = quantity
 
         self._set_item(variant_id, product_id, new_quantity)
+        self._invalidate_pricing()
         self.storage.mark_modified()
 
     def remove_product(self, variant_id):
@@ -76,6 +82,7 @@ class CartSession:
                 },
             )
             del self._cart["items"][key]
+            self._invalidate_pricing()
             self.storage.mark_modified()
 
     def update_quantity_product(self, variant_id, quantity: int):
@@ -95,36 +102,34 @@ class CartSession:
                     "quantity_change": quantity - old_quantity,
                 },
             )
+            self._invalidate_pricing()
             self.storage.mark_modified()
 
     def get_cart_dict(self):
         return self._cart
 
-    def get_cart_items(self):
-        cart_items = OrderedDict()
-        items = self._cart.get("items", OrderedDict())
-
-        for key in items:
-            item = items[key]
-            variant_id = int(key.replace("v", ""))
-            variant_obj = ProductVariantModel.objects.select_related(
-                "product", "attribute_value"
-            ).get(
-                id=variant_id,
-                product__status=ProductStatusType.PUBLISH.value,
+    def _get_pricing(self):
+        if self._pricing is None:
+            self._pricing = self.pricing_engine.calculate(
+                self._cart.get("items", OrderedDict())
             )
+            self._drop_items(self._pricing["missing_variant_ids"])
+        return self._pricing
+
+    def _drop_items(self, variant_ids):
+        # unavailable variants are left out of the totals, so they are
+        # dropped from the cart too and the session counters agree
+        if not variant_ids:
+            return
+        for variant_id in variant_ids:
+            self._cart["items"].pop(f"v{variant_id}", None)
+        self.storage.mark_modified()
 
-            cart_items[key] = {
-                **item,
-                "variant_obj": variant_obj,
-                "total_price_without_discount": item["quantity"]
-                * variant_obj.price,
-                "total_price_with_discount": item["quantity"]
-                * variant_obj.final_price,
-                "total_discounts": item["quantity"] * variant_obj.price
-                - item["quantity"] * variant_obj.final_price,
-            }
-        return cart_items
+    def _invalidate_pricing(self):
+        self._pricing = None
+
+    def get_cart_items(self):
+        return self._get_pricing()["cart_items"]
 
     def get_cart_item(self, variant_id):
         return self._cart["items"].get(f"v{variant_id}", {})
@@ -132,10 +137,7 @@ class CartSession:
     def get_total_payment_amount(
         self, shipping_method: ShippingMethodModel = None
     ):
-        result = sum(
-            item["total_price_with_discount"]
-            for item in self.get_cart_items().values()
-        )
+        result = self._get_pricing()["total_payment_amount"]
 
         return (
             result
@@ -144,25 +146,18 @@ class CartSession:
         )
 
     def get_total_amount_without_discount(self):
-        return sum(
-            item["total_price_without_discount"]
-            for item in self.get_cart_items().values()
-        )
+        return self._get_pricing()["total_amount_without_discount"]
 
     def get_total_discounts(self):
-        return sum(
-            item["total_discounts"] for item in self.get_cart_items().values()
-        )
+        return self._get_pricing()["total_discounts"]
 
     def get_total_quantity(self):
-        return sum(
-            int(item.get("quantity", 0) or 0)
-            for item in self._cart.get("items", {}).values()
-        )
+        return self._get_pricing()["total_quantity"]
 
     def clear(self):
         items_count = len(self._cart["items"])
         del self._cart["items"]
+        self._invalidate_pricing()
         self.storage.mark_modified()
         apps_logger.info(
             "Cart cleared", extra={"cleared_items_count": items_count}
@@ -192,6 +187,7 @@ class CartSession:
             },
         )
         self.merge_session_cart_in_db(user)
+        self._invalidate_pricing()
         self.storage.mark_modified()
 
     def merge_session_cart_in_db(self, user):
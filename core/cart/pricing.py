@@ -0,0 +1,75 @@
+import logging
+
+from collections import OrderedDict
+
+from shop.models import ProductVariantModel, ProductStatusType
+from core.constants import TaskName, LoggerName
+
+apps_logger = logging.getLogger(LoggerName.APPS)
+
+
+class CartPricingEngine:
+    def get_variants(self, variant_ids):
+        return (
+            ProductVariantModel.objects.select_related(
+                "product", "attribute_value"
+            )
+            .filter(product__status=ProductStatusType.PUBLISH.value)
+            .in_bulk(variant_ids)
+        )
+
+    def calculate(self, items):
+        variant_ids = [int(key.replace("v", "")) for key in items]
+        variants = self.get_variants(variant_ids) if variant_ids else {}
+
+        cart_items = OrderedDict()
+        total_amount_without_discount = 0
+        total_payment_amount = 0
+        total_discounts = 0
+        total_quantity = 0
+        missing_variant_ids = []
+
+        for key, item in items.items():
+            variant_id = int(key.replace("v", ""))
+            variant_obj = variants.get(variant_id)
+            if variant_obj is None:
+                missing_variant_ids.append(variant_id)
+                continue
+
+            quantity = item["quantity"]
+            total_price_without_discount = quantity * variant_obj.price
+            total_price_with_discount = quantity * variant_obj.final_price
+            item_discounts = (
+                total_price_without_discount - total_price_with_discount
+            )
+
+            cart_items[key] = {
+                **item,
+                "variant_obj": variant_obj,
+                "total_price_without_discount": total_price_without_discount,
+                "total_price_with_discount": total_price_with_discount,
+                "total_discounts": item_discounts,
+            }
+
+            total_amount_without_discount += total_price_without_discount
+            total_payment_amount += total_price_with_discount
+            total_discounts += item_discounts
+            total_quantity += quantity
+
+        if missing_variant_ids:
+            apps_logger.warning(
+                "Cart contains unavailable variants",
+                extra={
+                    "task_name": TaskName.CART_PRICING,
+                    "variant_ids": missing_variant_ids,
+                },
+            )
+
+        return {
+            "cart_items": cart_items,
+            "total_amount_without_discount": total_amount_without_discount,
+            "total_payment_amount": total_payment_amount,
+            "total_discounts": total_discounts,
+            "total_quantity": total_quantity,
+            "missing_variant_ids": missing_variant_ids,
+        }
@@ -1,6 +1,6 @@
 from collections import OrderedDict
 from cart.cart import CartSession
-from cart.storage import BaseStorage
+from cart.storage import BaseStorage, SessionStorage
 from order.models import ShippingMethodModel
 
 
@@ -100,3 +100,36 @@ class CartService:
 
     def sync(self, user):
         return self.cart.sync_cart_items_from_db(user)
+
+
+class LazyCartService:
+    session_key = "cart"
+
+    def __init__(self, request, service_class=CartService):
+        self.request = request
+        self.service_class = service_class
+        self._service = None
+
+    @property
+    def service(self):
+        if self._service is None:
+            self._service = self.service_class(
+                SessionStorage(self.request.session),
+                getattr(self.request, "user", None),
+            )
+        return self._service
+
+    def _session_items(self):
+        return self.request.session.get(self.session_key, {}).get("items", {})
+
+    def total_quantity(self):
+        return sum(
+            int(item.get("quantity", 0) or 0)
+            for item in self._session_items().values()
+        )
+
+    def items_count(self):
+        return len(self._session_items())
+
+    def __getattr__(self, name):
+        return getattr(self.service, name)
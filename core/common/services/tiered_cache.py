@@ -0,0 +1,252 @@
+import logging
+import time
+from collections import Counter
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from core.constants import TaskName, LoggerName
+
+apps_logger = logging.getLogger(LoggerName.APPS)
+
+
+class TieredVersionedCache:
+    """
+    Two-tier versioned cache: a per-process local memory tier (L1) in
+    front of the shared Redis tier.
+
+    The payload is stored under a fixed key as a `(version, data)` pair,
+    so one `get_many` returns both the current version and the payload.
+    A payload whose version is behind is stale: one worker takes a lock
+    and rebuilds it while the others keep serving the stale copy.
+
+    Subclasses list model labels in `invalidate_on`; saving or deleting
+    one of them bumps the version after the transaction commits. Caches
+    keyed per object set `key`/`version_key` per instance, bump them with
+    `bump_version` and group their stats under `stats_name`.
+    """
+
+    key = None
+    version_key = None
+    timeout = None
+    local_timeout = 60 * 5
+    version_local_timeout = 10
+
+    lock_timeout = 30
+    lock_wait_interval = 0.05
+    lock_wait_attempts = 20
+
+    invalidate_on = ()
+    invalidate_task_name = TaskName.CACHE_INVALIDATE
+
+    shared_alias = "default"
+    local_alias = "local"
+
+    stats = Counter()
+    stats_name = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for label in cls.__dict__.get("invalidate_on", ()):
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    cls._invalidate_receiver,
+                    sender=label,
+                    weak=False,
+                    dispatch_uid=f"{cls.__qualname__}:{label}:{id(signal)}",
+                )
+
+    def __init__(self, provider=None):
+        self.provider = provider
+        self.served_version = None
+        self.shared = caches[self.shared_alias]
+        self.local = caches[self.local_alias]
+
+    def load(self):
+        raise NotImplementedError
+
+    @property
+    def _stats_key(self):
+        return self.stats_name or self.key
+
+    def _record(self, outcome):
+        self.stats[(self._stats_key, outcome)] += 1
+
+    @classmethod
+    def get_stats(cls):
+        stats = {}
+        for (key, outcome), count in cls.stats.items():
+            stats.setdefault(key, {})[outcome] = count
+        return stats
+
+    def _get_local(self):
+        version = self.local.get(self.version_key)
+        if version is not None:
+            entry = self.local.get(self.key)
+            if entry is not None and entry[0] == version:
+                self._record("local_hit")
+                self.served_version = entry[0]
+                return True, entry[1]
+        return False, None
+
+    def _resolve(self, values):
+        version = values.get(self.version_key)
+        if version is None:
+            version = 1
+            self.shared.add(self.version_key, version, None)
+
+        entry = values.get(self.key)
+        if entry is not None and entry[0] == version:
+            self._record("shared_hit")
+        else:
+            self._record("miss")
+            entry = self._rebuild(version, stale=entry)
+
+        self.local.set(self.version_key, version, self.version_local_timeout)
+        self.local.set(self.key, entry, self.local_timeout)
+        self.served_version = entry[0]
+        return entry[1]
+
+    def get(self):
+        hit, data = self._get_local()
+        if hit:
+            return data
+
+        values = self.shared.get_many([self.version_key, self.key])
+        return self._resolve(values)
+
+    @classmethod
+    def get_many(cls, cache_managers):
+        """
+        Resolve several caches at once: L1 first, then a single shared
+        `get_many` for everything L1 could not answer.
+        """
+        results = {}
+        pending = []
+        for manager in cache_managers:
+            hit, data = manager._get_local()
+            if hit:
+                results[manager.key] = data
+            else:
+                pending.append(manager)
+
+        if pending:
+            keys = []
+            for manager in pending:
+                keys.extend((manager.version_key, manager.key))
+            values = caches[cls.shared_alias].get_many(keys)
+            for manager in pending:
+                results[manager.key] = manager._resolve(values)
+
+        return [results[manager.key] for manager in cache_managers]
+
+    def _store(self, version):
+        started = time.monotonic()
+        entry = (version, self.load())
+        self.shared.set(self.key, entry, self.timeout)
+        self._record("rebuild")
+
+        apps_logger.info(
+            "Cache rebuilt",
+            extra={
+                "task_name": TaskName.CACHE_REBUILD,
+                "cache_key": self.key,
+                "version": version,
+                "duration_ms": int((time.monotonic() - started) * 1000),
+                "stats": self.get_stats().get(self._stats_key, {}),
+            },
+        )
+        return entry
+
+    def _rebuild(self, version, stale=None):
+        lock_key = f"{self.key}_lock"
+        if self.shared.add(lock_key, 1, self.lock_timeout):
+            try:
+                return self._store(version)
+            finally:
+                self.shared.delete(lock_key)
+
+        if stale is not None:
+            self._record("stale_hit")
+            return stale
+
+        for _ in range(self.lock_wait_attempts):
+            time.sleep(self.lock_wait_interval)
+            entry = self.shared.get(self.key)
+            if entry is not None and entry[0] == version:
+                return entry
+
+        return (version, self.load())
+
+    def refresh(self):
+        version = self.shared.get(self.version_key) or 1
+        entry = self._store(version)
+        self.local.set(self.key, entry, self.local_timeout)
+        return entry[1]
+
+    @classmethod
+    def bump_version(cls, version_key):
+        shared = caches[cls.shared_alias]
+        try:
+            shared.incr(version_key)
+        except ValueError:
+            shared.set(version_key, 2, None)
+        caches[cls.local_alias].delete(version_key)
+
+    @classmethod
+    def invalidate(cls):
+        cls.bump_version(cls.version_key)
+
+    @classmethod
+    def _invalidate_receiver(cls, sender, instance, **kwargs):
+        created = kwargs.get("created")
+        if created is None:
+            action = "deleted"
+        else:
+            action = "created" if created else "updated"
+
+        transaction.on_commit(cls.invalidate)
+
+        apps_logger.info(
+            f"{cls.__name__} invalidated after {sender.__name__} {action}",
+            extra={
+                "task_name": cls.invalidate_task_name,
+                "model": sender._meta.label,
+                "object_id": getattr(instance, "pk", None),
+                "action": action,
+            },
+        )
+
+
+class KeyedTieredVersionedCache(TieredVersionedCache):
+    """
+    A TieredVersionedCache with one key and one version per object, e.g.
+    per product. `key_template` and `version_key_template` are formatted
+    with `object_id`.
+    """
+
+    key_template = None
+    version_key_template = None
+
+    def __init__(self, object_id, provider=None):
+        super().__init__(provider)
+        self.object_id = object_id
+        self.key = self.key_template.format(object_id=object_id)
+        self.version_key = self.version_key_template.format(
+            object_id=object_id
+        )
+
+    @classmethod
+    def invalidate_object(cls, object_id):
+        cls.bump_version(cls.version_key_template.format(object_id=object_id))
+
+    @classmethod
+    def invalidate_on_commit(cls, object_ids):
+        object_ids = {oid for oid in object_ids if oid is not None}
+
+        def invalidate():
+            for object_id in object_ids:
+                cls.invalidate_object(object_id)
+
+        transaction.on_commit(invalidate)
@@ -22,12 +22,14 @@ class TaskName(str, Enum):
     CART_ITEM_CLEAR = "cart_item_remove"
     CART_SYNC = "cart_sync"
     CART_MERGE = "cart_merge"
+    CART_PRICING = "cart_pricing"
 
     COUPON_APPLY = "coupon_apply"
 
     REPAYMENT = "repayment"
     GENERATE_PAYMENT_URL = "generate_payment_url"
     GET_DOMAIN = "get_domain"
+    PAYMENT_GATEWAY_HTTP = "payment_gateway_http"
     PAYMENT_REQUEST = "payment_request"
     PAYMENT_VERIFY = "payment_verify"
 
@@ -42,6 +44,7 @@ class TaskName(str, Enum):
     PAYMENT_SUCCESS = "payment_success"
     PAYMENT_FAILED = "payment_failed"
     PAYMENT_PROCESS = "payment_process"
+    PAYMENT_RECONCILE = "payment_reconcile"
 
     ORDER_VALIDATE_STOCK = "order_validate_stock"
     ORDER_UPDATE_CART_ITEMS = "order_update_cart_items"
@@ -50,6 +53,8 @@ class TaskName(str, Enum):
     ORDER_TRY_GET = "order_try_get"
     ORDER_UPDATE_STATUS = "order_update_status"
     ORDER_CHECKOUT_SHIPPING = "order_checkout_shipping"
+    ORDER_CANCEL_EXPIRED = "order_cancel_expired"
+    ORDER_RECORD_SALES = "order_record_sales"
 
     ADDRESS_CREATE = "address_create"
     ADDRESS_DELETE = "address_delete"
@@ -62,14 +67,23 @@ class TaskName(str, Enum):
     PRODUCT_COMMENT_VOTE_DUPLICATE = "product_comment_vote_duplicate"
     PRODUCT_COMMENT_VOTE_SWITCH = "product_comment_vote_switch"
     PRODUCT_COMMENT_VOTE_NEW = "product_comment_vote_new"
+    PRODUCT_COMMENT_THREAD = "product_comment_thread"
 
     PRODUCT_VARIANT = "product_variant"
 
+    SEARCH_LOG_ADD = "search_log_add"
+
+    CACHE_INVALIDATE = "cache_invalidate"
+    CACHE_REBUILD = "cache_rebuild"
+
     CATEGORY_CACHE_INVALIDATE = "category_cache_invalidate"
 
     SITE_INFO_CACHE_INVALIDATE = "site_info_cache_invalidate"
     SITE_RESOURCE_CACHE_INVALIDATE = "site_resource_cache_invalidate"
 
+    UNREAD_MESSAGES_COUNTER = "unread_messages_counter"
+    ORDER_NOTIFICATIONS = "order_notifications"
+
     WISHLIST_REMOVE = "wishlist_remove"
     WISHLIST_ADD = "wishlist_add"
     WISHLIST_ERROR = "wishlist_error"
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
     "django_celery_beat",
     "debug_toolbar",
     "django_summernote",
@@ -94,15 +95,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
-                "cart.context_processors.cart_processor",
-                "shop.context_processors.categories_processor",
-                "shop.context_processors.search_log_processor",
-                "notifications.context_processors.new_messages_count_processor",
-                "pages.context_processors.static_pages_processor",
-                "account.context_processors.user_processor",
-                "website.context_processors.site_info_processor",
-                "website.context_processors.site_resource_socials_processor",
-                "website.context_processors.site_resource_licenses_processor",
+                "website.context_processors.layout_processor",
             ],
         },
     },
@@ -324,6 +317,29 @@ LOGGING = {
 }
 
 
+REDIS_URL = config("REDIS_URL", default="redis://redis:6379/1")
+
+
+# cache configuration: redis is the shared tier, "local" is a per-process
+# L1 tier used by common.services.tiered_cache for hot, rarely changing keys
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": REDIS_URL,
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "SOCKET_CONNECT_TIMEOUT": 2,
+            "SOCKET_TIMEOUT": 2,
+        },
+    },
+    "local": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "local-l1",
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    },
+}
+
+
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
@@ -361,6 +377,22 @@ ROOT_URLCONF = "core.urls"
 
 PAYMENT_SANDBOX_MODE = True
 
+# gateway base URLs can point at `manage.py run_stub_gateway` locally
+ZARINPAL_SANDBOX_URL = config(
+    "ZARINPAL_SANDBOX_URL", default="https://sandbox.zarinpal.com"
+)
+ZARINPAL_PRODUCTION_URL = config(
+    "ZARINPAL_PRODUCTION_URL", default="https://api.zarinpal.com"
+)
+ZARINPAL_PAYMENT_PAGE_URL = config(
+    "ZARINPAL_PAYMENT_PAGE_URL", default="https://www.zarinpal.com"
+)
+PAYMENT_GATEWAY_CONNECT_TIMEOUT = 3
+PAYMENT_GATEWAY_READ_TIMEOUT = 10
+PAYMENT_GATEWAY_POOL_SIZE = 10
+PAYMENT_GATEWAY_VERIFY_RETRIES = 3
+PAYMENT_GATEWAY_RETRY_BACKOFF = 0.5
+
 # Site configuration
 SITE_ID = 1
 
@@ -370,4 +402,16 @@ CELERY_BEAT_SCHEDULE = {
         "task": "order.tasks.cancel_expired_pending_orders",
         "schedule": timedelta(minutes=1),
     },
+    "reconcile-pending-payments": {
+        "task": "payment.tasks.reconcile_pending_payments",
+        "schedule": timedelta(minutes=1),
+    },
+    "flush-search-logs": {
+        "task": "shop.tasks.flush_search_logs",
+        "schedule": timedelta(minutes=1),
+    },
+    "refresh-popular-searches": {
+        "task": "shop.tasks.refresh_popular_searches",
+        "schedule": timedelta(minutes=15),
+    },
 }
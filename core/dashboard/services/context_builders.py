@@ -1,5 +1,5 @@
 from datetime import timedelta
-from django.db.models import Count, Q, Subquery, OuterRef, Prefetch
+from django.db.models import Count, F, Q, Prefetch
 from django.utils.timezone import now
 
 
@@ -13,7 +13,6 @@ from order.models import (
 )
 from wishlist.models import WishlistProductModel
 from common.services.pagination_builders import build_pagination_items
-from payment.models import PaymentModel
 
 
 class CounterContextBuilder(BaseContextBuilder):
@@ -63,7 +62,7 @@ class CounterContextBuilder(BaseContextBuilder):
         self.context["status_counts"] = status_counts
         self.context["newest_orders"] = all_orders.filter(
             created_date__gte=now() - timedelta(days=2)
-        ).prefetch_related("payment")
+        ).select_related("latest_payment")
 
 
 class OrderListContextBuilder(BaseContextBuilder):
@@ -76,8 +75,6 @@ class OrderListContextBuilder(BaseContextBuilder):
     def get_base_data(self):
         return {}
 
-    from django.db.models import OuterRef, Subquery, Prefetch
-
     def _add_order_data(self):
         self.context["status_counts"] = OrderModel.objects.filter(
             user=self.request.user
@@ -98,15 +95,13 @@ class OrderListContextBuilder(BaseContextBuilder):
             total_count=Count("id"),
         )
 
-        latest_payment_qs = PaymentModel.objects.filter(
-            order=OuterRef("pk")
-        ).order_by("-created_date")
-
         pending_orders_qs = (
             OrderModel.objects.filter(
                 user=self.request.user, status=OrderStatusType.PENDING
             )
-            .select_related("shipping_method", "coupon", "address")
+            .select_related(
+                "shipping_method", "coupon", "address", "latest_payment"
+            )
             .prefetch_related(
                 Prefetch(
                     "order_items",
@@ -116,12 +111,8 @@ class OrderListContextBuilder(BaseContextBuilder):
                 )
             )
             .annotate(
-                latest_payment_status=Subquery(
-                    latest_payment_qs.values("status")[:1]
-                ),
-                latest_payment_created=Subquery(
-                    latest_payment_qs.values("created_date")[:1]
-                ),
+                latest_payment_status=F("latest_payment__status"),
+                latest_payment_created=F("latest_payment__created_date"),
             )
             .order_by("-created_date")[:5]
         )
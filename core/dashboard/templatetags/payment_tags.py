@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from django import template
 from django.utils import timezone
 
@@ -6,13 +8,16 @@ register = template.Library()
 
 @register.filter
 def remaining_minutes(value):
-    if hasattr(value, "order_by"):
+    if hasattr(value, "expired_date"):
+        expired_date = value.expired_date
+
+    elif hasattr(value, "order_by"):
         payment = value.order_by("-created_date").first()
         if not payment or not hasattr(payment, "expired_date"):
             return 0
         expired_date = payment.expired_date
 
-    elif isinstance(value, timezone.datetime.__class__):
+    elif isinstance(value, datetime):
         expired_date = value + timezone.timedelta(minutes=11)
 
     else:
@@ -49,7 +49,11 @@ from payment.services import PaymentService
 from notifications.models import (
     MessageModel,
     MessageType,
-    UserMessageStatusModel,
+)
+from notifications.services.broadcast import BroadcastStateService
+from notifications.services.unread import (
+    UnreadMessageCounter,
+    on_commit_counter_update,
 )
 from account.views import BaseOTPView
 from core.constants import TaskName, LoggerName
@@ -203,10 +207,8 @@ class RepaymentView(LoginRequiredMixin, View):
                     OrderModel.objects.filter(
                         status=OrderStatusType.FAILED.value
                     )
-                    .select_related("address")
-                    .prefetch_related(
-                        "order_items__product_variant__product", "payment"
-                    )
+                    .select_related("address", "latest_payment__gateway")
+                    .prefetch_related("order_items__product_variant__product")
                     .get(id=order_id, user=self.request.user)
                 )
             except OrderModel.DoesNotExist:
@@ -292,7 +294,11 @@ class RepaymentView(LoginRequiredMixin, View):
                     }
                 )
 
-            latest_payment = order.payment.latest("created_date")
+            latest_payment = order.latest_payment
+            if latest_payment is None:
+                return JsonResponse(
+                    {"status": "error", "message": "پرداختی یافت نشد"}
+                )
             request.session["payment_data"] = {
                 "gateway": latest_payment.gateway,
             }
@@ -334,7 +340,9 @@ class GeneratePaymentUrlView(LoginRequiredMixin, View):
         order_id = request.GET.get("order_id")
         if order_id:
             try:
-                order = OrderModel.objects.get(
+                order = OrderModel.objects.select_related(
+                    "latest_payment__gateway"
+                ).get(
                     id=order_id,
                     user=self.request.user,
                     status=OrderStatusType.PENDING.value,
@@ -357,9 +365,9 @@ class GeneratePaymentUrlView(LoginRequiredMixin, View):
 
             now = timezone.now()
 
-            payment = order.payment.latest("created_date")
+            payment = order.latest_payment
 
-            if payment.expired_date < now:
+            if payment is None or payment.expired_date < now:
                 payment_logger.warning(
                     "Payment gateway expired",
                     extra={
@@ -484,22 +492,27 @@ class MessageListView(LoginRequiredMixin, ListView):
                 )
             )
         )
-        broadcast_messages = MessageModel.objects.filter(
-            Q(type=MessageType.BROADCAST.value)
-            & ~Q(user_statuses__user=user, user_statuses__is_hidden=True)
+        broadcast_state = BroadcastStateService.get_state(user.id)
+        broadcast_messages = BroadcastStateService.visible_broadcasts(
+            user.id, broadcast_state
         )
 
-        personal_and_order_messages.update(is_read=True)
+        read_count = personal_and_order_messages.filter(is_read=False).update(
+            is_read=True
+        )
+        broadcasts_read = BroadcastStateService.mark_all_read(
+            user.id, broadcast_state
+        )
 
-        new_broadcasts = broadcast_messages.exclude(user_statuses__user=user)
-        if new_broadcasts.exists():
-            UserMessageStatusModel.objects.bulk_create(
-                [
-                    UserMessageStatusModel(
-                        user=user, message=message, is_read=True
-                    )
-                    for message in new_broadcasts
-                ]
+        counter = UnreadMessageCounter()
+        if broadcasts_read:
+            on_commit_counter_update(
+                lambda: counter.reset_user(user.id), user_id=user.id
+            )
+        elif read_count:
+            on_commit_counter_update(
+                lambda: counter.add_direct({user.id: -read_count}),
+                user_id=user.id,
             )
 
         return personal_and_order_messages | broadcast_messages
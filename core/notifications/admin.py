@@ -1,6 +1,10 @@
 from django.contrib import admin
 
-from .models import MessageModel, UserMessageStatusModel
+from .models import (
+    BroadcastStateModel,
+    MessageModel,
+    UserMessageStatusModel,
+)
 
 
 @admin.register(MessageModel)
@@ -59,3 +63,20 @@ class UserMessageStatusAdmin(admin.ModelAdmin):
     )
 
     readonly_fields = ("created_date", "updated_date")
+
+
+@admin.register(BroadcastStateModel)
+class BroadcastStateAdmin(admin.ModelAdmin):
+    list_display = (
+        "user",
+        "last_read_broadcast_id",
+        "hidden_through_broadcast_id",
+        "updated_date",
+    )
+    search_fields = ("user__phone",)
+    raw_id_fields = ("user",)
+    list_select_related = ("user",)
+    ordering = ("-updated_date",)
+    list_per_page = 25
+
+    readonly_fields = ("created_date", "updated_date")
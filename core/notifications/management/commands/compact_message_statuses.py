@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from notifications.services.broadcast import BroadcastStatusCompactor
+from notifications.services.unread import UnreadMessageCounter
+
+
+class Command(BaseCommand):
+    help = "Fold per-broadcast message status rows into read watermarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of users compacted per transaction",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        self.stdout.write("Compacting broadcast message statuses...")
+        users, deleted = BroadcastStatusCompactor(batch_size=batch_size).run()
+        UnreadMessageCounter().reset_all()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\nCompleted!"
+                f"\n• Users compacted: {users}"
+                f"\n• Status rows removed: {deleted}"
+            )
+        )
@@ -41,6 +41,12 @@ class MessageModel(TimeStampedModel):
     class Meta:
         verbose_name = _("پیام")
         verbose_name_plural = _("پیام‌ها")
+        indexes = [
+            models.Index(fields=["type", "id"], name="idx_message_type_id"),
+            models.Index(
+                fields=["user", "is_read"], name="idx_message_user_read"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_type_display()} - {self.title}"
@@ -67,3 +73,26 @@ class UserMessageStatusModel(TimeStampedModel):
         ordering = ("-created_date",)
         verbose_name = _("وضعیت پیام کاربر")
         verbose_name_plural = _("وضعیت‌های پیام کاربران")
+
+
+class BroadcastStateModel(TimeStampedModel):
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="broadcast_state",
+        verbose_name=_("کاربر"),
+    )
+    last_read_broadcast_id = models.PositiveBigIntegerField(
+        default=0, verbose_name=_("آخرین پیام عمومی خوانده شده")
+    )
+    hidden_through_broadcast_id = models.PositiveBigIntegerField(
+        default=0, verbose_name=_("پنهان‌سازی پیام‌های عمومی تا")
+    )
+
+    class Meta:
+        verbose_name = _("وضعیت پیام‌های عمومی کاربر")
+        verbose_name_plural = _("وضعیت پیام‌های عمومی کاربران")
+
+    def __str__(self):
+        return f"{self.user} - {self.last_read_broadcast_id}"
@@ -0,0 +1,158 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from notifications.models import (
+    BroadcastStateModel,
+    MessageModel,
+    MessageType,
+    UserMessageStatusModel,
+)
+
+
+class BroadcastStateService:
+    """
+    Broadcast read state is a per-user watermark: every broadcast with an
+    id at or below `last_read_broadcast_id` is read, and every one at or
+    below `hidden_through_broadcast_id` is hidden. Individually hidden
+    broadcasts above the watermark are sparse UserMessageStatusModel rows.
+    """
+
+    @staticmethod
+    def get_state(user_id):
+        state = BroadcastStateModel.objects.filter(user_id=user_id).first()
+        return state or BroadcastStateModel(user_id=user_id)
+
+    @staticmethod
+    def get_latest_broadcast_id():
+        return (
+            MessageModel.objects.filter(type=MessageType.BROADCAST.value)
+            .order_by("-id")
+            .values_list("id", flat=True)
+            .first()
+        ) or 0
+
+    @staticmethod
+    def _hidden_sparse(user_id):
+        return UserMessageStatusModel.objects.filter(
+            user_id=user_id, message=OuterRef("pk"), is_hidden=True
+        )
+
+    @classmethod
+    def visible_broadcasts(cls, user_id, state):
+        return MessageModel.objects.filter(
+            type=MessageType.BROADCAST.value,
+            id__gt=state.hidden_through_broadcast_id,
+        ).filter(~Exists(cls._hidden_sparse(user_id)))
+
+    @classmethod
+    def unread_broadcasts(cls, user_id, state):
+        read_through = max(
+            state.last_read_broadcast_id, state.hidden_through_broadcast_id
+        )
+        return MessageModel.objects.filter(
+            type=MessageType.BROADCAST.value, id__gt=read_through
+        ).filter(~Exists(cls._hidden_sparse(user_id)))
+
+    @classmethod
+    def _advance(cls, user_id, state, field):
+        latest_id = cls.get_latest_broadcast_id()
+        if latest_id <= getattr(state, field):
+            return False
+
+        BroadcastStateModel.objects.update_or_create(
+            user_id=user_id, defaults={field: latest_id}
+        )
+        setattr(state, field, latest_id)
+        return True
+
+    @classmethod
+    def mark_all_read(cls, user_id, state):
+        return cls._advance(user_id, state, "last_read_broadcast_id")
+
+    @classmethod
+    def hide_all(cls, user_id, state):
+        return cls._advance(user_id, state, "hidden_through_broadcast_id")
+
+
+class BroadcastStatusCompactor:
+    """
+    Folds legacy per-broadcast UserMessageStatusModel rows into the
+    watermarks. A watermark covers the longest run of broadcasts, oldest
+    first, that the user had read (or hidden); hide rows above that run
+    are kept as sparse records, everything else is deleted.
+    """
+
+    def __init__(self, batch_size=500):
+        self.batch_size = batch_size
+        self.broadcast_ids = list(
+            MessageModel.objects.filter(type=MessageType.BROADCAST.value)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    def _watermark(self, message_ids):
+        watermark = 0
+        for broadcast_id in self.broadcast_ids:
+            if broadcast_id not in message_ids:
+                break
+            watermark = broadcast_id
+        return watermark
+
+    def _compact_users(self, user_ids):
+        statuses = defaultdict(list)
+        for row in UserMessageStatusModel.objects.filter(
+            user_id__in=user_ids
+        ).values_list("id", "user_id", "message_id", "is_read", "is_hidden"):
+            statuses[row[1]].append(row)
+
+        states = []
+        obsolete_ids = []
+        for user_id, rows in statuses.items():
+            hidden = {message_id for _, _, message_id, _, h in rows if h}
+            seen = {message_id for _, _, message_id, r, h in rows if r or h}
+            hidden_through = self._watermark(hidden)
+            states.append(
+                BroadcastStateModel(
+                    user_id=user_id,
+                    last_read_broadcast_id=self._watermark(seen),
+                    hidden_through_broadcast_id=hidden_through,
+                )
+            )
+            obsolete_ids.extend(
+                status_id
+                for status_id, _, message_id, _, is_hidden in rows
+                if not is_hidden or message_id <= hidden_through
+            )
+
+        with transaction.atomic():
+            BroadcastStateModel.objects.bulk_create(
+                states,
+                update_conflicts=True,
+                unique_fields=["user"],
+                update_fields=[
+                    "last_read_broadcast_id",
+                    "hidden_through_broadcast_id",
+                ],
+            )
+            deleted, _ = UserMessageStatusModel.objects.filter(
+                id__in=obsolete_ids
+            ).delete()
+        return len(states), deleted
+
+    def run(self):
+        user_ids = list(
+            UserMessageStatusModel.objects.order_by("user_id")
+            .values_list("user_id", flat=True)
+            .distinct()
+        )
+        users = 0
+        deleted = 0
+        for start in range(0, len(user_ids), self.batch_size):
+            batch_users, batch_deleted = self._compact_users(
+                user_ids[start : start + self.batch_size]
+            )
+            users += batch_users
+            deleted += batch_deleted
+        return users, deleted
@@ -0,0 +1,135 @@
+import logging
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Prefetch
+
+from order.models import (
+    FulfillmentStatus,
+    OrderItemModel,
+    OrderModel,
+    OrderStatusType,
+)
+from notifications.models import MessageModel, MessageType
+from .unread import UnreadMessageCounter, on_commit_counter_update
+from core.constants import TaskName, LoggerName
+
+apps_logger = logging.getLogger(LoggerName.APPS)
+
+
+def build_order_event(order, created):
+    return {
+        "order_id": order.id,
+        "user_id": order.user_id,
+        "created": created,
+        "old_status": None if created else order.tracker.previous("status"),
+        "status": order.status,
+        "old_fulfillment": (
+            None if created else order.tracker.previous("fulfillment_status")
+        ),
+        "fulfillment": order.fulfillment_status,
+    }
+
+
+def publish_order_events(events):
+    from notifications.tasks import process_order_events
+
+    events = [event for event in events if event_has_message(event)]
+    if events:
+        transaction.on_commit(lambda: process_order_events.delay(events))
+
+
+def event_has_message(event):
+    return (
+        event["created"]
+        or (event["old_status"] and event["old_status"] != event["status"])
+        or (
+            event["old_fulfillment"]
+            and event["old_fulfillment"] != event["fulfillment"]
+        )
+    )
+
+
+def build_order_message(event, order=None):
+    order_id = event["order_id"]
+
+    if event["created"]:
+        return {
+            "title": "ثبت سفارش جدید",
+            "body": f"سفارش شماره {order_id} با مبلغ {order.get_amount()} ثبت شد.",
+        }
+
+    if event["old_status"] and event["old_status"] != event["status"]:
+        return {
+            "title": f"تغییر وضعیت سفارش {order_id}",
+            "body": f"وضعیت سفارش شما به '{OrderStatusType(event['status']).label}' تغییر کرد.",
+        }
+
+    if (
+        event["old_fulfillment"]
+        and event["old_fulfillment"] != event["fulfillment"]
+    ):
+        return {
+            "title": f"بروزرسانی ارسال سفارش {order_id}",
+            "body": f"وضعیت ارسال سفارش شما به '{FulfillmentStatus(event['fulfillment']).label}' تغییر کرد.",
+        }
+
+    return None
+
+
+def create_order_messages(events):
+    created_ids = [event["order_id"] for event in events if event["created"]]
+    orders = (
+        OrderModel.objects.select_related("shipping_method", "coupon")
+        .prefetch_related(
+            Prefetch(
+                "order_items",
+                queryset=OrderItemModel.objects.only(
+                    "order_id",
+                    "base_price",
+                    "variant_discount_percent",
+                    "quantity",
+                ),
+            )
+        )
+        .in_bulk(created_ids)
+        if created_ids
+        else {}
+    )
+
+    messages = []
+    for event in events:
+        order = orders.get(event["order_id"])
+        if event["created"] and order is None:
+            continue
+
+        message_data = build_order_message(event, order)
+        if message_data:
+            messages.append(
+                MessageModel(
+                    type=MessageType.ORDER,
+                    title=message_data["title"],
+                    body=message_data["body"],
+                    user_id=event["user_id"],
+                    order_id=event["order_id"],
+                )
+            )
+
+    with transaction.atomic():
+        MessageModel.objects.bulk_create(messages)
+
+        counts = Counter(message.user_id for message in messages)
+        on_commit_counter_update(
+            lambda: UnreadMessageCounter().add_direct(counts),
+            user_ids=list(counts),
+        )
+
+    apps_logger.info(
+        "Order messages created",
+        extra={
+            "task_name": TaskName.ORDER_NOTIFICATIONS,
+            "events": len(events),
+            "messages": len(messages),
+        },
+    )
+    return len(messages)
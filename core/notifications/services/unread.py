@@ -0,0 +1,157 @@
+import logging
+import uuid
+
+from redis import RedisError
+from django.db import transaction
+
+from common.services.redis_client import get_redis_client
+from notifications.models import MessageModel, MessageType
+from .broadcast import BroadcastStateService
+from core.constants import TaskName, LoggerName
+
+apps_logger = logging.getLogger(LoggerName.APPS)
+
+DIRECT_MESSAGE_TYPES = [MessageType.ORDER.value, MessageType.PERSONAL.value]
+
+# HINCRBY only when the hash already exists: a missing hash is rebuilt
+# from the database on the next read, so it must not be recreated here.
+HINCRBY_IF_EXISTS = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return redis.call('hincrby', KEYS[1], ARGV[1], ARGV[2])
+end
+return false
+"""
+
+
+class UnreadMessageCounter:
+    """
+    Unread messages per user = unread direct (order/personal) messages
+    + broadcasts the user has not read.
+
+    Redis keeps one global hash with the broadcast total and a generation
+    token, and one hash per user with `direct`, `broadcast_read` and the
+    generation it was built against. Rebuilding the global hash issues a
+    new generation, which lazily rebuilds every user hash. A user's
+    `broadcast_read` is derived from their broadcast watermark.
+    """
+
+    broadcast_key = "unread_messages:broadcast"
+    user_key_template = "unread_messages:user:{user_id}"
+    user_timeout = 60 * 60 * 24 * 7
+
+    def __init__(self, client=None):
+        self.client = client or get_redis_client()
+        self._hincrby = self.client.register_script(HINCRBY_IF_EXISTS)
+
+    def _user_key(self, user_id):
+        return self.user_key_template.format(user_id=user_id)
+
+    def _build_broadcast(self):
+        state = {
+            "total": MessageModel.objects.filter(
+                type=MessageType.BROADCAST.value
+            ).count(),
+            "generation": uuid.uuid4().hex,
+        }
+        self.client.hset(self.broadcast_key, mapping=state)
+        return state
+
+    def _build_user(self, user_id, total, generation):
+        broadcast_state = BroadcastStateService.get_state(user_id)
+        unread_broadcasts = BroadcastStateService.unread_broadcasts(
+            user_id, broadcast_state
+        ).count()
+        state = {
+            "direct": count_unread_direct(user_id),
+            "broadcast_read": max(total - unread_broadcasts, 0),
+            "generation": generation,
+        }
+        user_key = self._user_key(user_id)
+        pipe = self.client.pipeline()
+        pipe.hset(user_key, mapping=state)
+        pipe.expire(user_key, self.user_timeout)
+        pipe.execute()
+        return state
+
+    def get(self, user_id):
+        pipe = self.client.pipeline()
+        pipe.hgetall(self.broadcast_key)
+        pipe.hgetall(self._user_key(user_id))
+        broadcast, user = pipe.execute()
+
+        if broadcast:
+            total = int(broadcast[b"total"])
+            generation = broadcast[b"generation"].decode()
+        else:
+            state = self._build_broadcast()
+            total, generation = state["total"], state["generation"]
+
+        if user and user.get(b"generation", b"").decode() == generation:
+            direct = int(user[b"direct"])
+            broadcast_read = int(user[b"broadcast_read"])
+        else:
+            state = self._build_user(user_id, total, generation)
+            direct, broadcast_read = state["direct"], state["broadcast_read"]
+
+        return direct + max(total - broadcast_read, 0)
+
+    def add_direct(self, counts):
+        pipe = self.client.pipeline()
+        for user_id, amount in counts.items():
+            self._hincrby(
+                keys=[self._user_key(user_id)],
+                args=["direct", amount],
+                client=pipe,
+            )
+        pipe.execute()
+
+    def add_broadcast(self, amount=1):
+        self._hincrby(keys=[self.broadcast_key], args=["total", amount])
+
+    def reset_user(self, user_id):
+        self.client.delete(self._user_key(user_id))
+
+    def reset_all(self):
+        self.client.delete(self.broadcast_key)
+
+
+def count_unread_direct(user_id):
+    return MessageModel.objects.filter(
+        user_id=user_id, type__in=DIRECT_MESSAGE_TYPES, is_read=False
+    ).count()
+
+
+def _safely(operation, **extra):
+    try:
+        operation()
+    except RedisError:
+        apps_logger.warning(
+            "Unread message counter update failed",
+            extra={"task_name": TaskName.UNREAD_MESSAGES_COUNTER, **extra},
+            exc_info=True,
+        )
+
+
+def on_commit_counter_update(operation, **extra):
+    transaction.on_commit(lambda: _safely(operation, **extra))
+
+
+def get_unread_messages_count(user):
+    try:
+        return UnreadMessageCounter().get(user.id)
+    except RedisError:
+        apps_logger.warning(
+            "Unread message counter unavailable, counting from database",
+            extra={
+                "task_name": TaskName.UNREAD_MESSAGES_COUNTER,
+                "user_id": user.id,
+            },
+        )
+
+    broadcast_state = BroadcastStateService.get_state(user.id)
+    return (
+        count_unread_direct(user.id)
+        + BroadcastStateService.unread_broadcasts(
+            user.id, broadcast_state
+        ).count()
+    )
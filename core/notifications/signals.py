@@ -1,50 +1,83 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
-from order.models import OrderModel, OrderStatusType, FulfillmentStatus
+from order.models import OrderModel
+from order.signals import orders_status_changed
 from .models import MessageModel, MessageType
+from .services.order_events import build_order_event, publish_order_events
+from .services.unread import (
+    DIRECT_MESSAGE_TYPES,
+    UnreadMessageCounter,
+    on_commit_counter_update,
+)
 
 
-def build_order_message(order, created, old_status=None, old_fulfillment=None):
-
+@receiver(post_save, sender=OrderModel)
+def order_message_handler(sender, instance, created, **kwargs):
+    # the "created" event is published by
+    # OrderService.validate_and_create_order once the items exist
     if created:
-        return {
-            "title": "ثبت سفارش جدید",
-            "body": f"سفارش شماره {order.id} با مبلغ {order.get_amount()} ثبت شد.",
-        }
+        return
+    publish_order_events([build_order_event(instance, created)])
 
-    if old_status and old_status != order.status:
-        return {
-            "title": f"تغییر وضعیت سفارش {order.id}",
-            "body": f"وضعیت سفارش شما به '{OrderStatusType(order.status).label}' تغییر کرد.",
-        }
 
-    if old_fulfillment and old_fulfillment != order.fulfillment_status:
-        return {
-            "title": f"بروزرسانی ارسال سفارش {order.id}",
-            "body": f"وضعیت ارسال سفارش شما به '{FulfillmentStatus(order.fulfillment_status).label}' تغییر کرد.",
-        }
+@receiver(orders_status_changed, sender=OrderModel)
+def orders_status_changed_handler(
+    sender, order_ids, old_status, new_status, **kwargs
+):
+    orders = OrderModel.objects.filter(id__in=order_ids).only("id", "user_id")
+    publish_order_events(
+        [
+            {
+                "order_id": order.id,
+                "user_id": order.user_id,
+                "created": False,
+                "old_status": old_status,
+                "status": new_status,
+                "old_fulfillment": None,
+                "fulfillment": None,
+            }
+            for order in orders
+        ]
+    )
 
-    return None
 
+@receiver(post_save, sender=MessageModel)
+def update_unread_counter_on_save(sender, instance, created, **kwargs):
+    if instance.type == MessageType.BROADCAST:
+        if created:
+            on_commit_counter_update(
+                lambda: UnreadMessageCounter().add_broadcast(),
+                message_id=instance.id,
+            )
+        return
+
+    if instance.type in DIRECT_MESSAGE_TYPES and instance.user_id:
+        if created and not instance.is_read:
+
+            def operation():
+                UnreadMessageCounter().add_direct({instance.user_id: 1})
+
+        else:
+
+            def operation():
+                UnreadMessageCounter().reset_user(instance.user_id)
+
+        on_commit_counter_update(operation, message_id=instance.id)
+
+
+@receiver(post_delete, sender=MessageModel)
+def update_unread_counter_on_delete(sender, instance, **kwargs):
+    if instance.type == MessageType.BROADCAST:
+
+        def operation():
+            UnreadMessageCounter().reset_all()
+
+    elif instance.user_id:
+
+        def operation():
+            UnreadMessageCounter().reset_user(instance.user_id)
 
-@receiver(post_save, sender=OrderModel)
-def order_message_handler(sender, instance, created, **kwargs):
-    if created:
-        message_data = build_order_message(instance, created)
     else:
-        old_status = instance.tracker.previous("status")
-        old_fulfillment = instance.tracker.previous("fulfillment_status")
-
-        message_data = build_order_message(
-            instance, created, old_status, old_fulfillment
-        )
-
-    if message_data:
-        MessageModel.objects.create(
-            type=MessageType.ORDER,
-            title=message_data["title"],
-            body=message_data["body"],
-            user=instance.user,
-            order=instance,
-        )
+        return
+    on_commit_counter_update(operation, message_id=instance.id)
@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from .services.order_events import create_order_messages
+
+
+@shared_task
+def process_order_events(events):
+    return create_order_messages(events)
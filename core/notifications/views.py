@@ -2,7 +2,9 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.http import JsonResponse
 
-from .models import MessageModel, MessageType, UserMessageStatusModel
+from .models import MessageModel, MessageType
+from .services.broadcast import BroadcastStateService
+from .services.unread import UnreadMessageCounter, on_commit_counter_update
 
 
 class RemoveAllMessagesView(LoginRequiredMixin, View):
@@ -12,12 +14,11 @@ class RemoveAllMessagesView(LoginRequiredMixin, View):
             type__in=[MessageType.ORDER, MessageType.PERSONAL],
         ).delete()
 
-        broadcast_messages = MessageModel.objects.filter(
-            type=MessageType.BROADCAST
-        )
-        for msg in broadcast_messages:
-            UserMessageStatusModel.objects.update_or_create(
-                user=request.user, message=msg, defaults={"is_hidden": True}
+        broadcast_state = BroadcastStateService.get_state(request.user.id)
+        if BroadcastStateService.hide_all(request.user.id, broadcast_state):
+            on_commit_counter_update(
+                lambda: UnreadMessageCounter().reset_user(request.user.id),
+                user_id=request.user.id,
             )
 
         return JsonResponse(
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef, Subquery
+
+from order.models import OrderModel
+from payment.models import PaymentModel
+
+
+class Command(BaseCommand):
+    help = "Point every order's latest_payment at its newest payment"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Backfilling order latest payments...")
+        latest_payment_id = (
+            PaymentModel.objects.filter(order=OuterRef("pk"))
+            .order_by("-created_date")
+            .values("id")[:1]
+        )
+        updated = OrderModel.objects.update(
+            latest_payment=Subquery(latest_payment_id)
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\nCompleted!" f"\n• Orders updated: {updated}"
+            )
+        )
@@ -1,27 +1,49 @@
+from django.conf import settings
 from django.db import models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Concat
 from django.utils import timezone
 from datetime import timedelta
 
-from payment.models import PaymentStatusType
-from payment.services import PaymentService
+from payment.models import PaymentGatewayType, PaymentStatusType
 
 
 class OrderQuerySet(models.QuerySet):
     def with_payment_urls(self):
-        now = timezone.now()
-        qs = self.select_related("payment__gateway")
-
-        for order in qs:
-            payment = getattr(order, "payment", None)
-            if (
-                payment
-                and payment.status == PaymentStatusType.PENDING
-                and payment.created_date >= now - timedelta(minutes=11)
-            ):
-                order.payment_url = PaymentService.generate_url(payment)
-            else:
-                order.payment_url = None
-        return qs
+        from payment.factories import PaymentFactoryCreator
+
+        sandbox = getattr(settings, "PAYMENT_SANDBOX_MODE", True)
+        url_prefixes = [
+            (
+                name,
+                PaymentFactoryCreator.get_factory(
+                    gateway_name=name, sandbox=sandbox
+                )
+                .create_payment_processor()
+                .generate_payment_url(""),
+            )
+            for name in PaymentGatewayType.values
+        ]
+
+        return self.select_related("latest_payment").annotate(
+            payment_url=Case(
+                *[
+                    When(
+                        latest_payment__gateway__name=name,
+                        latest_payment__status=PaymentStatusType.PENDING,
+                        latest_payment__created_date__gte=(
+                            timezone.now() - timedelta(minutes=11)
+                        ),
+                        then=Concat(
+                            Value(prefix), F("latest_payment__authority_id")
+                        ),
+                    )
+                    for name, prefix in url_prefixes
+                ],
+                default=Value(None),
+                output_field=models.CharField(),
+            )
+        )
 
     def filter_by_status_title(self, status_title: str):
         from .models import OrderStatusType, FulfillmentStatus
@@ -151,11 +151,25 @@ class OrderModel(TimeStampedModel):
         blank=True,
         verbose_name=_("وضعیت تکمیل"),
     )
+    latest_payment = models.ForeignKey(
+        "payment.PaymentModel",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("آخرین پرداخت"),
+    )
     tracker = FieldTracker()
 
     objects = OrderManager()
 
     class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "updated_date"],
+                name="idx_order_status_updated",
+            ),
+        ]
         verbose_name = _("سفارش")
         verbose_name_plural = _("سفارش‌ها")
 
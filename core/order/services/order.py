@@ -1,11 +1,23 @@
 import logging
 from django.db import transaction
+from django.db.models import Sum
 from django.core.exceptions import ValidationError
+from redis import RedisError
 
 from cart.storage import SessionStorage
 from cart.services.cart import CartService
 from order.models import OrderItemModel, OrderModel, OrderStatusType
 from cart.models import CartModel
+from shop.models import ProductVariantModel
+from shop.services.product_summary.refresh import ProductSummaryService
+from notifications.services.order_events import (
+    build_order_event,
+    publish_order_events,
+)
+from shop.services.best_seller.ranking import (
+    BestSellerRanking,
+    ProductSalesService,
+)
 from core.constants import TaskName, LoggerName
 
 apps_logger = logging.getLogger(LoggerName.APPS)
@@ -13,13 +25,20 @@ apps_logger = logging.getLogger(LoggerName.APPS)
 
 class StockValidationService:
     @staticmethod
-    def validate_stock(items):
+    def validate_stock(items, stock_by_variant=None):
         errors = []
         items_to_update = []
 
         for item in items:
-            if item.product_variant.stock < item.quantity:
-                if item.product_variant.stock == 0:
+            if stock_by_variant is None:
+                available_stock = item.product_variant.stock
+            else:
+                available_stock = stock_by_variant.get(
+                    item.product_variant_id, 0
+                )
+
+            if available_stock < item.quantity:
+                if available_stock == 0:
                     errors.append(
                         f"محصول {item.product_variant.product.name} موجود نمی‌باشد"
                     )
@@ -40,7 +59,7 @@ class StockValidationService:
                     items_to_update.append(
                         {
                             "item": item,
-                            "new_quantity": item.product_variant.stock,
+                            "new_quantity": available_stock,
                         }
                     )
                     apps_logger.warning(
@@ -49,8 +68,8 @@ class StockValidationService:
                             "task_name": TaskName.ORDER_VALIDATE_STOCK,
                             "product": item.product_variant.product.name,
                             "requested_quantity": item.quantity,
-                            "available_stock": item.product_variant.stock,
-                            "new_quantity": item.product_variant.stock,
+                            "available_stock": available_stock,
+                            "new_quantity": available_stock,
                         },
                     )
 
@@ -76,39 +95,73 @@ class StockValidationService:
 
 
 class OrderCreationService:
+    @staticmethod
+    def lock_variants(variant_ids):
+        queryset = (
+            ProductVariantModel.objects.select_for_update()
+            .filter(id__in=variant_ids)
+            .order_by("id")
+        )
+        return {variant.id: variant for variant in queryset}
+
     @staticmethod
     @transaction.atomic
     def create_order_items(order: OrderModel, cart: CartModel):
-        for cart_item in cart.cart_items.all():
-            cart_item.product_variant.stock -= cart_item.quantity
-            cart_item.product_variant.save()
-            apps_logger.info(
-                "Stock reduced for product",
-                extra={
-                    "task_name": TaskName.ORDER_CREATE_ITEMS,
-                    "order_id": order.id,
-                    "user_id": order.user.id,
-                    "product": cart_item.product_variant.product.name,
-                    "quantity": cart_item.quantity,
-                    "remaining_stock": cart_item.product_variant.stock,
-                    "correlation_id": getattr(order, "correlation_id", None),
-                },
-            )
-            OrderItemModel.objects.create(
-                order=order,
-                product_variant=cart_item.product_variant,
-                quantity=cart_item.quantity,
-                base_price=cart_item.product_variant.price,
-                variant_discount_percent=cart_item.product_variant.discount_percent,
+        cart_items = list(
+            cart.cart_items.select_related("product_variant__product")
+        )
+        variants = OrderCreationService.lock_variants(
+            sorted({item.product_variant_id for item in cart_items})
+        )
+
+        errors, items_to_update = StockValidationService.validate_stock(
+            cart_items,
+            {variant_id: v.stock for variant_id, v in variants.items()},
+        )
+        if errors:
+            return errors, items_to_update
+
+        order_items = []
+        for cart_item in cart_items:
+            variant = variants[cart_item.product_variant_id]
+            variant.stock -= cart_item.quantity
+            order_items.append(
+                OrderItemModel(
+                    order=order,
+                    product_variant=variant,
+                    quantity=cart_item.quantity,
+                    base_price=variant.price,
+                    variant_discount_percent=variant.discount_percent,
+                )
             )
 
+        ProductVariantModel.objects.bulk_update(variants.values(), ["stock"])
+        OrderItemModel.objects.bulk_create(order_items)
+        product_ids = {variant.product_id for variant in variants.values()}
+        ProductSummaryService.refresh_after_bulk_stock_update(product_ids)
+
+        apps_logger.info(
+            "Stock reserved for order items",
+            extra={
+                "task_name": TaskName.ORDER_CREATE_ITEMS,
+                "order_id": order.id,
+                "user_id": order.user_id,
+                "reserved": {
+                    item.product_variant_id: item.quantity
+                    for item in cart_items
+                },
+                "correlation_id": getattr(order, "correlation_id", None),
+            },
+        )
+        return [], []
+
 
 class OrderService:
     @staticmethod
     def validate_and_create_order(order: OrderModel, cart: CartModel, request):
 
-        errors, items_to_update = StockValidationService.validate_stock(
-            cart.cart_items.all()
+        errors, items_to_update = OrderCreationService.create_order_items(
+            order, cart
         )
 
         if errors:
@@ -128,7 +181,10 @@ class OrderService:
             )
             raise ValidationError(errors)
 
-        OrderCreationService.create_order_items(order, cart)
+        # published here rather than on post_save: the "new order" message
+        # needs the items, and a rejected order must not announce itself
+        publish_order_events([build_order_event(order, created=True)])
+
         apps_logger.info(
             "Order validated and items created successfully",
             extra={
@@ -166,9 +222,48 @@ class OrderService:
             return "error", order
 
     @staticmethod
+    def get_order_sales(order: OrderModel):
+        return {
+            row["product_variant__product_id"]: row["quantity"]
+            for row in order.order_items.values(
+                "product_variant__product_id"
+            ).annotate(quantity=Sum("quantity"))
+        }
+
+    @staticmethod
+    def record_order_sales(order: OrderModel):
+        sales = OrderService.get_order_sales(order)
+        ProductSalesService.record_sales(sales)
+
+        def record_ranking():
+            try:
+                BestSellerRanking().record(sales)
+            except RedisError as e:
+                apps_logger.warning(
+                    "Best seller ranking update failed",
+                    extra={
+                        "task_name": TaskName.ORDER_RECORD_SALES,
+                        "order_id": order.id,
+                        "error": str(e),
+                    },
+                )
+
+        transaction.on_commit(record_ranking)
+
+    @staticmethod
+    @transaction.atomic
     def update_status_after_success_payment(order: OrderModel):
+        current_status = (
+            OrderModel.objects.select_for_update()
+            .filter(id=order.id)
+            .values_list("status", flat=True)
+            .first()
+        )
+        already_paid = current_status == OrderStatusType.SUCCESS
         order.status = OrderStatusType.SUCCESS
         order.save()
+        if not already_paid:
+            OrderService.record_order_sales(order)
         apps_logger.info(
             "Order status updated to SUCCESS",
             extra={
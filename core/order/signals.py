@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent after a queryset-level status update, which bypasses post_save.
+# Arguments: order_ids, old_status, new_status.
+orders_status_changed = Signal()
@@ -1,28 +1,128 @@
+import logging
+import time
 from datetime import timedelta
 
 from celery import shared_task
 from django.db import transaction
+from django.db.models import Case, Exists, F, OuterRef, Sum, Value, When
 from django.utils import timezone
 
+from shop.models import ProductVariantModel
+from shop.services.product_summary.refresh import ProductSummaryService
+from payment.models import PaymentModel, PaymentStatusType
+from .models import OrderModel, OrderItemModel, OrderStatusType
+from .signals import orders_status_changed
+from core.constants import TaskName, LoggerName
 
-from .models import OrderModel, OrderStatusType
+apps_logger = logging.getLogger(LoggerName.APPS)
 
+PAYMENT_RECONCILE_WINDOW = timedelta(minutes=15)
 
-@shared_task
-def cancel_expired_pending_orders():
-    cutoff_time = timezone.now() - timedelta(minutes=11)
 
+def restore_order_items_stock(order_ids):
+    restored = {
+        row["product_variant_id"]: row["quantity"]
+        for row in OrderItemModel.objects.filter(order_id__in=order_ids)
+        .values("product_variant_id")
+        .annotate(quantity=Sum("quantity"))
+    }
+    if not restored:
+        return set()
+
+    variant_ids = sorted(restored)
+    list(
+        ProductVariantModel.objects.select_for_update()
+        .filter(id__in=variant_ids)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    ProductVariantModel.objects.filter(id__in=variant_ids).update(
+        stock=F("stock")
+        + Case(
+            *[
+                When(id=variant_id, then=Value(quantity))
+                for variant_id, quantity in restored.items()
+            ],
+            default=Value(0),
+        )
+    )
+    return set(
+        ProductVariantModel.objects.filter(id__in=variant_ids).values_list(
+            "product_id", flat=True
+        )
+    )
+
+
+def cancel_expired_orders_chunk(cutoff_time, chunk_size):
     with transaction.atomic():
-        pending_orders = OrderModel.objects.select_for_update().filter(
-            status=OrderStatusType.PENDING.value, updated_date__lte=cutoff_time
+        order_ids = list(
+            OrderModel.objects.select_for_update(skip_locked=True)
+            .filter(
+                status=OrderStatusType.PENDING.value,
+                updated_date__lte=cutoff_time,
+            )
+            # leave orders whose gateway payment may still be reconciled
+            .exclude(
+                Exists(
+                    PaymentModel.objects.filter(
+                        order=OuterRef("pk"),
+                        status=PaymentStatusType.PENDING.value,
+                        created_date__gt=(
+                            timezone.now() - PAYMENT_RECONCILE_WINDOW
+                        ),
+                    )
+                )
+            )
+            .order_by("id")
+            .values_list("id", flat=True)[:chunk_size]
+        )
+        if not order_ids:
+            return []
+
+        product_ids = restore_order_items_stock(order_ids)
+        OrderItemModel.objects.filter(order_id__in=order_ids).delete()
+        OrderModel.objects.filter(id__in=order_ids).update(
+            status=OrderStatusType.FAILED.value, updated_date=timezone.now()
         )
+        ProductSummaryService.refresh_after_bulk_stock_update(product_ids)
 
-        for order in pending_orders:
-            order.status = OrderStatusType.FAILED.value
-            order.save()
+        transaction.on_commit(
+            lambda: orders_status_changed.send(
+                sender=OrderModel,
+                order_ids=order_ids,
+                old_status=OrderStatusType.PENDING.value,
+                new_status=OrderStatusType.FAILED.value,
+            )
+        )
+    return order_ids
+
+
+@shared_task
+def cancel_expired_pending_orders(chunk_size=200, max_chunks=50):
+    cutoff_time = timezone.now() - timedelta(minutes=11)
+    total_cancelled = 0
+
+    for _ in range(max_chunks):
+        started = time.monotonic()
+        order_ids = cancel_expired_orders_chunk(cutoff_time, chunk_size)
+        if not order_ids:
+            break
+
+        total_cancelled += len(order_ids)
+        apps_logger.info(
+            "Expired pending orders cancelled",
+            extra={
+                "task_name": TaskName.ORDER_CANCEL_EXPIRED,
+                "cancelled_count": len(order_ids),
+                "duration_ms": round((time.monotonic() - started) * 1000),
+            },
+        )
 
-            for order_item in order.order_items.all():
-                product_variant = order_item.product_variant
-                product_variant.stock += order_item.quantity
-                product_variant.save()
-                order_item.delete()
+    apps_logger.info(
+        "Expired pending orders cancellation finished",
+        extra={
+            "task_name": TaskName.ORDER_CANCEL_EXPIRED,
+            "cancelled_count": total_cancelled,
+        },
+    )
+    return total_cancelled
@@ -0,0 +1,10 @@
+from common.services.tiered_cache import TieredVersionedCache
+
+
+class StaticPageCache(TieredVersionedCache):
+    key = "static_pages"
+    version_key = "static_pages_version"
+    invalidate_on = ("pages.StaticPageModel",)
+
+    def load(self):
+        return self.provider.get_active()
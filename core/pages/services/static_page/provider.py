@@ -0,0 +1,10 @@
+from pages.models import StaticPageModel
+
+
+class StaticPageProvider:
+    def get_active(self):
+        return list(
+            StaticPageModel.objects.filter(is_active=True).only(
+                "id", "slug", "title"
+            )
+        )
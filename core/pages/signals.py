@@ -0,0 +1,2 @@
+# imported so the declarative invalidate_on receivers get connected
+from .services.static_page.cache import StaticPageCache  # noqa: F401
@@ -0,0 +1,104 @@
+import json
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+
+class StubGatewayHandler(BaseHTTPRequestHandler):
+    delay = 0
+    fail_every = 0
+    requests_served = 0
+
+    def _send_json(self, status, body):
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+
+        cls = type(self)
+        cls.requests_served += 1
+        if cls.delay:
+            time.sleep(cls.delay)
+        if cls.fail_every and cls.requests_served % cls.fail_every == 0:
+            return self._send_json(503, {"errors": {"message": "stub"}})
+
+        if self.path.endswith("/payment/request.json"):
+            return self._send_json(
+                200,
+                {
+                    "data": {
+                        "code": 100,
+                        "message": "Success",
+                        "authority": f"S{uuid.uuid4().hex[:35]}",
+                    },
+                    "errors": [],
+                },
+            )
+        if self.path.endswith("/payment/verify.json"):
+            return self._send_json(
+                200,
+                {
+                    "data": {
+                        "code": 100,
+                        "message": "Verified",
+                        "ref_id": int(time.time() * 1000),
+                        "authority": payload.get("authority"),
+                    },
+                    "errors": [],
+                },
+            )
+        return self._send_json(404, {"errors": {"message": "not found"}})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local ZarinPal-compatible stub gateway for tests and "
+        "benchmarks (point ZARINPAL_SANDBOX_URL at it)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=0,
+            help="Seconds to sleep before answering each request",
+        )
+        parser.add_argument(
+            "--fail-every",
+            type=int,
+            default=0,
+            help="Answer every Nth request with 503 to exercise retries",
+        )
+
+    def handle(self, *args, **options):
+        StubGatewayHandler.delay = options["delay"]
+        StubGatewayHandler.fail_every = options["fail_every"]
+
+        server = ThreadingHTTPServer(
+            (options["host"], options["port"]), StubGatewayHandler
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stub gateway listening on "
+                f"http://{options['host']}:{options['port']}"
+            )
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -92,6 +92,19 @@ class PaymentModel(TimeStampedModel):
     description = models.TextField(blank=True, verbose_name=_("توضیحات"))
 
     class Meta:
+        indexes = [
+            models.Index(
+                fields=["authority_id"], name="idx_payment_authority"
+            ),
+            models.Index(
+                fields=["order", "-created_date"],
+                name="idx_payment_order_created",
+            ),
+            models.Index(
+                fields=["status", "created_date"],
+                name="idx_payment_status_created",
+            ),
+        ]
         verbose_name = _("پرداخت")
         verbose_name_plural = _("پرداخت‌ها")
 
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from core.constants import TaskName, LoggerName
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+payment_logger = logging.getLogger(LoggerName.PAYMENT)
+
+JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+RETRY_STATUSES = (502, 503, 504)
+
+
+class PaymentGatewayError(Exception):
+    pass
+
+
+def _timeout():
+    return (
+        settings.PAYMENT_GATEWAY_CONNECT_TIMEOUT,
+        settings.PAYMENT_GATEWAY_READ_TIMEOUT,
+    )
+
+
+def _build_session(retries):
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=settings.PAYMENT_GATEWAY_RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"POST"}) if retries else None,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.PAYMENT_GATEWAY_POOL_SIZE,
+        pool_maxsize=settings.PAYMENT_GATEWAY_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.headers.update(JSON_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class GatewayHttpClient:
+    """
+    Keep-alive sessions shared by every processor in the worker process.
+    Payment requests are never retried (a retry could open a second
+    payment); verify calls are idempotent and retried with backoff.
+    """
+
+    _sessions = {}
+
+    @classmethod
+    def get_session(cls, idempotent=False):
+        session = cls._sessions.get(idempotent)
+        if session is None:
+            retries = (
+                settings.PAYMENT_GATEWAY_VERIFY_RETRIES if idempotent else 0
+            )
+            session = cls._sessions[idempotent] = _build_session(retries)
+        return session
+
+    def post_json(self, url, payload, idempotent=False):
+        session = self.get_session(idempotent)
+        try:
+            response = session.post(url, json=payload, timeout=_timeout())
+            return response.json()
+        except (requests.RequestException, ValueError) as e:
+            payment_logger.error(
+                "Payment gateway call failed",
+                extra={
+                    "task_name": TaskName.PAYMENT_GATEWAY_HTTP,
+                    "url": url,
+                    "idempotent": idempotent,
+                    "error": str(e),
+                },
+            )
+            raise PaymentGatewayError(str(e)) from e
+
+
+class AsyncGatewayHttpClient:
+    """
+    httpx based variant of GatewayHttpClient for ASGI views. httpx is an
+    optional dependency and is only needed when this client is used.
+    """
+
+    _client = None
+
+    @classmethod
+    def get_client(cls):
+        if httpx is None:
+            raise ImproperlyConfigured(
+                "httpx is required for the async payment gateway client"
+            )
+        if cls._client is None:
+            cls._client = httpx.AsyncClient(
+                headers=JSON_HEADERS,
+                timeout=httpx.Timeout(
+                    settings.PAYMENT_GATEWAY_READ_TIMEOUT,
+                    connect=settings.PAYMENT_GATEWAY_CONNECT_TIMEOUT,
+                ),
+                limits=httpx.Limits(
+                    max_keepalive_connections=(
+                        settings.PAYMENT_GATEWAY_POOL_SIZE
+                    ),
+                ),
+            )
+        return cls._client
+
+    async def post_json(self, url, payload, idempotent=False):
+        client = self.get_client()
+        attempts = (
+            settings.PAYMENT_GATEWAY_VERIFY_RETRIES + 1 if idempotent else 1
+        )
+
+        for attempt in range(attempts):
+            try:
+                response = await client.post(url, json=payload)
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or attempt == attempts - 1
+                ):
+                    return response.json()
+            except httpx.TransportError as e:
+                if attempt == attempts - 1:
+                    payment_logger.error(
+                        "Payment gateway call failed",
+                        extra={
+                            "task_name": TaskName.PAYMENT_GATEWAY_HTTP,
+                            "url": url,
+                            "idempotent": idempotent,
+                            "error": str(e),
+                        },
+                    )
+                    raise PaymentGatewayError(str(e)) from e
+            except ValueError as e:
+                raise PaymentGatewayError(str(e)) from e
+
+            await asyncio.sleep(
+                settings.PAYMENT_GATEWAY_RETRY_BACKOFF * (2**attempt)
+            )
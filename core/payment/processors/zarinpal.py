@@ -1,24 +1,20 @@
-import json
-import requests
 from django.urls import reverse
 from django.conf import settings
 from .base import BasePaymentProcessor, BasePaymentVerifier
+from .http import GatewayHttpClient, AsyncGatewayHttpClient
 import logging
 from core.constants import TaskName, LoggerName
 
 payment_logger = logging.getLogger(LoggerName.PAYMENT)
 
+_callback_url = None
+
 
 def get_domain():
     try:
         from django.contrib.sites.models import Site
 
-        domain = Site.objects.get_current().domain
-        payment_logger.info(
-            "Domain retrieved successfully",
-            extra={"task_name": TaskName.GET_DOMAIN, "domain": domain},
-        )
-        return domain
+        return Site.objects.get_current().domain
     except BaseException as e:
         payment_logger.warning(
             "Fallback to default domain due to error",
@@ -28,7 +24,7 @@ def get_domain():
                 "error": str(e),
             },
         )
-        return "example.com"
+        return None
 
 
 def get_protocol():
@@ -37,200 +33,189 @@ def get_protocol():
     )
 
 
-class ZarinPalSandboxProcessor(BasePaymentProcessor):
+def get_callback_url():
+    global _callback_url
+    if _callback_url is not None:
+        return _callback_url
 
-    _payment_request_url = (
-        "https://sandbox.zarinpal.com/pg/v4/payment/request.json"
+    domain = get_domain()
+    callback_url = (
+        f"{get_protocol()}://{domain or 'example.com'}"
+        f"{reverse('payment:verify')}"
     )
-    _payment_page_url = "https://sandbox.zarinpal.com/pg/StartPay/"
+    # the fallback domain is not cached so the real one is retried later
+    if domain is not None:
+        _callback_url = callback_url
+    return callback_url
+
+
+def clear_callback_url_cache(**kwargs):
+    global _callback_url
+    _callback_url = None
+
 
-    def __init__(self, merchant_id=settings.MERCHANT_ID):
+class ZarinPalProcessor(BasePaymentProcessor):
+    environment = None
+
+    def __init__(
+        self, merchant_id=settings.MERCHANT_ID, client=None, async_client=None
+    ):
         self.merchant_id = merchant_id
+        self.client = client or GatewayHttpClient()
+        self.async_client = async_client or AsyncGatewayHttpClient()
 
     @property
-    def _callback_url(self):
-        return f"{get_protocol()}://{get_domain()}{reverse('payment:verify')}"
+    def _api_url(self):
+        raise NotImplementedError
 
-    def payment_request(self, amount, description="پرداختی کاربر"):
+    @property
+    def _payment_page_url(self):
+        raise NotImplementedError
+
+    @property
+    def _payment_request_url(self):
+        return f"{self._api_url}/pg/v4/payment/request.json"
 
-        payload = {
+    @property
+    def _callback_url(self):
+        return get_callback_url()
+
+    def _build_payload(self, amount, description):
+        return {
             "merchant_id": self.merchant_id,
             "amount": str(amount),
             "callback_url": self._callback_url,
-            "description": "افزایش اعتبار کاربر شماره ۱۱۳۴۶۲۹",
+            "description": description,
             "metadata": {
                 "mobile": "09195523234",
                 "email": "info.davari@gmail.com",
             },
         }
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
 
-        response = requests.post(
-            self._payment_request_url,
-            headers=headers,
-            data=json.dumps(payload),
-        )
-        result = response.json()
+    def _log_result(self, amount, result):
+        data = result.get("data") or {}
         payment_logger.info(
-            "Payment request sent successfully to ZarinPal sandbox",
+            f"Payment request sent to ZarinPal {self.environment}",
             extra={
                 "task_name": TaskName.PAYMENT_REQUEST,
                 "merchant_id": self.merchant_id,
                 "amount": amount,
-                "authority": result["data"]["authority"],
-                "response_code": result["data"].get("code"),
+                "authority": data.get("authority"),
+                "response_code": data.get("code"),
             },
         )
         return result
 
-    def generate_payment_url(self, authority):
-        payment_url = f"{self._payment_page_url}{authority}"
-        payment_logger.info(
-            "Payment URL generated successfully for ZarinPal sandbox",
-            extra={
-                "task_name": TaskName.GENERATE_PAYMENT_URL,
-                "merchant_id": self.merchant_id,
-                "authority": authority,
-                "payment_url": payment_url,
-            },
+    def payment_request(self, amount, description="پرداختی کاربر"):
+        result = self.client.post_json(
+            self._payment_request_url,
+            self._build_payload(amount, description),
+        )
+        return self._log_result(amount, result)
+
+    async def apayment_request(self, amount, description="پرداختی کاربر"):
+        result = await self.async_client.post_json(
+            self._payment_request_url,
+            self._build_payload(amount, description),
         )
-        return payment_url
+        return self._log_result(amount, result)
 
+    def generate_payment_url(self, authority):
+        return f"{self._payment_page_url}{authority}"
 
-class ZarinPalSandboxVerifier(BasePaymentVerifier):
 
-    _payment_verify_url = (
-        "https://sandbox.zarinpal.com/pg/v4/payment/verify.json"
-    )
+class ZarinPalVerifier(BasePaymentVerifier):
+    environment = None
 
-    def __init__(self, merchant_id=settings.MERCHANT_ID):
+    def __init__(
+        self, merchant_id=settings.MERCHANT_ID, client=None, async_client=None
+    ):
         self.merchant_id = merchant_id
+        self.client = client or GatewayHttpClient()
+        self.async_client = async_client or AsyncGatewayHttpClient()
 
-    def payment_verify(self, amount, authority):
-        payload = {
+    @property
+    def _api_url(self):
+        raise NotImplementedError
+
+    @property
+    def _payment_verify_url(self):
+        return f"{self._api_url}/pg/v4/payment/verify.json"
+
+    def _build_payload(self, amount, authority):
+        return {
             "merchant_id": self.merchant_id,
             "amount": amount,
             "authority": authority,
         }
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
 
-        response = requests.post(
-            self._payment_verify_url, headers=headers, data=json.dumps(payload)
-        )
-        result = response.json()
+    def _log_result(self, amount, authority, result):
+        data = result.get("data") or {}
         payment_logger.info(
-            "Payment verification succeeded in ZarinPal sandbox",
+            f"Payment verification answered by ZarinPal {self.environment}",
             extra={
                 "task_name": TaskName.PAYMENT_VERIFY,
                 "merchant_id": self.merchant_id,
                 "amount": amount,
                 "authority": authority,
-                "ref_id": result["data"].get("ref_id"),
-                "response_code": result["data"].get("code"),
+                "ref_id": data.get("ref_id"),
+                "response_code": data.get("code"),
             },
         )
         return result
 
+    def payment_verify(self, amount, authority):
+        result = self.client.post_json(
+            self._payment_verify_url,
+            self._build_payload(amount, authority),
+            idempotent=True,
+        )
+        return self._log_result(amount, authority, result)
 
-class ZarinPalProductionProcessor(BasePaymentProcessor):
-    _payment_request_url = (
-        "https://api.zarinpal.com/pg/v4/payment/request.json"
-    )
-    _payment_page_url = "https://www.zarinpal.com/pg/StartPay/"
-    _callback_url = f"{get_protocol()}://{get_domain()}/payment/verify"
+    async def apayment_verify(self, amount, authority):
+        result = await self.async_client.post_json(
+            self._payment_verify_url,
+            self._build_payload(amount, authority),
+            idempotent=True,
+        )
+        return self._log_result(amount, authority, result)
 
-    def __init__(self, merchant_id=settings.MERCHANT_ID):
-        self.merchant_id = merchant_id
 
-    def payment_request(self, amount, description="پرداختی کاربر"):
-        payload = {
-            "merchant_id": self.merchant_id,
-            "amount": str(amount),
-            "callback_url": self._callback_url,
-            "description": description,
-            "metadata": {
-                "mobile": "09195523234",
-                "email": "info.davari@gmail.com",
-            },
-        }
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+class ZarinPalSandboxProcessor(ZarinPalProcessor):
+    environment = "sandbox"
 
-        response = requests.post(
-            self._payment_request_url,
-            headers=headers,
-            data=json.dumps(payload),
-        )
-        result = response.json()
+    @property
+    def _api_url(self):
+        return settings.ZARINPAL_SANDBOX_URL
 
-        payment_logger.info(
-            "Payment request sent successfully to ZarinPal production",
-            extra={
-                "task_name": TaskName.PAYMENT_REQUEST,
-                "merchant_id": self.merchant_id,
-                "amount": amount,
-                "authority": result["data"]["authority"],
-                "response_code": result["data"].get("code"),
-            },
-        )
+    @property
+    def _payment_page_url(self):
+        return f"{settings.ZARINPAL_SANDBOX_URL}/pg/StartPay/"
 
-        return result
 
-    def generate_payment_url(self, authority):
-        payment_url = f"{self._payment_page_url}{authority}"
-        payment_logger.info(
-            "Payment URL generated successfully for ZarinPal production",
-            extra={
-                "task_name": TaskName.GENERATE_PAYMENT_URL,
-                "merchant_id": self.merchant_id,
-                "authority": authority,
-                "payment_url": payment_url,
-            },
-        )
-        return payment_url
+class ZarinPalSandboxVerifier(ZarinPalVerifier):
+    environment = "sandbox"
 
+    @property
+    def _api_url(self):
+        return settings.ZARINPAL_SANDBOX_URL
 
-class ZarinPalProductionVerifier(BasePaymentVerifier):
 
-    _payment_verify_url = "https://api.zarinpal.com/pg/v4/payment/verify.json"
+class ZarinPalProductionProcessor(ZarinPalProcessor):
+    environment = "production"
 
-    def __init__(self, merchant_id=settings.MERCHANT_ID):
-        self.merchant_id = merchant_id
+    @property
+    def _api_url(self):
+        return settings.ZARINPAL_PRODUCTION_URL
 
-    def payment_verify(self, amount, authority):
-        payload = {
-            "merchant_id": self.merchant_id,
-            "amount": amount,
-            "authority": authority,
-        }
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+    @property
+    def _payment_page_url(self):
+        return f"{settings.ZARINPAL_PAYMENT_PAGE_URL}/pg/StartPay/"
 
-        response = requests.post(
-            self._payment_verify_url, headers=headers, data=json.dumps(payload)
-        )
-        result = response.json()
 
-        payment_logger.info(
-            "Payment verification succeeded in ZarinPal production",
-            extra={
-                "task_name": TaskName.PAYMENT_VERIFY,
-                "merchant_id": self.merchant_id,
-                "amount": amount,
-                "authority": authority,
-                "ref_id": result["data"].get("ref_id"),
-                "response_code": result["data"].get("code"),
-            },
-        )
+class ZarinPalProductionVerifier(ZarinPalVerifier):
+    environment = "production"
 
-        return result
+    @property
+    def _api_url(self):
+        return settings.ZARINPAL_PRODUCTION_URL
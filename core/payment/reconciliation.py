@@ -0,0 +1,149 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from order.models import OrderStatusType
+from order.services.order import OrderService
+from .factories import PaymentFactoryCreator
+from .models import PaymentModel, PaymentStatusType
+from .processors.http import PaymentGatewayError
+from .services import VERIFIED_CODES, _json_safe
+from core.constants import TaskName, LoggerName
+
+payment_logger = logging.getLogger(LoggerName.PAYMENT)
+
+
+class PaymentReconciliationService:
+    """
+    Verifies PENDING payments whose user never came back to the callback.
+    Gateway calls run concurrently in a thread pool and never touch the
+    database; results are applied one payment at a time under a row lock
+    and only while the payment is still PENDING, so running alongside the
+    callback view or another worker is harmless.
+    """
+
+    def __init__(
+        self,
+        batch_size=50,
+        max_workers=8,
+        min_age=timedelta(minutes=2),
+        fail_after=timedelta(minutes=15),
+        max_age=timedelta(days=1),
+    ):
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.min_age = min_age
+        self.fail_after = fail_after
+        self.max_age = max_age
+
+    def get_batch(self, after_id=0):
+        now = timezone.now()
+        return list(
+            PaymentModel.objects.filter(
+                status=PaymentStatusType.PENDING.value,
+                created_date__lte=now - self.min_age,
+                created_date__gte=now - self.max_age,
+                id__gt=after_id,
+            )
+            .exclude(authority_id="")
+            .select_related("gateway")
+            .order_by("id")[: self.batch_size]
+        )
+
+    def _verify(self, payment):
+        try:
+            verifier = PaymentFactoryCreator.get_factory(
+                gateway_name=payment.gateway.name,
+                sandbox=getattr(settings, "PAYMENT_SANDBOX_MODE", True),
+            ).create_payment_verifier()
+            return verifier.payment_verify(
+                int(payment.amount), payment.authority_id
+            )
+        except (PaymentGatewayError, ValueError):
+            return None
+
+    def verify_batch(self, payments):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(zip(payments, executor.map(self._verify, payments)))
+
+    def apply_result(self, payment, result):
+        data = (result or {}).get("data") or {}
+        code = data.get("code")
+        verified = code in VERIFIED_CODES
+        expired = payment.created_date <= timezone.now() - self.fail_after
+
+        if result is None or (not verified and not expired):
+            return None
+
+        with transaction.atomic():
+            locked = (
+                PaymentModel.objects.select_for_update()
+                .select_related("order__user")
+                .filter(id=payment.id, status=PaymentStatusType.PENDING.value)
+                .first()
+            )
+            if locked is None:
+                return None
+
+            locked.response_json = _json_safe(result)
+            locked.response_code = code
+            if verified:
+                locked.ref_id = data.get("ref_id")
+                locked.status = PaymentStatusType.SUCCESS.value
+            else:
+                locked.status = PaymentStatusType.FAILED.value
+            locked.save()
+
+            # a failed payment leaves the order PENDING so that
+            # cancel_expired_pending_orders releases its stock
+            if verified and locked.order:
+                if locked.order.status == OrderStatusType.FAILED:
+                    payment_logger.error(
+                        "Payment captured for a cancelled order",
+                        extra={
+                            "task_name": TaskName.PAYMENT_RECONCILE,
+                            "payment_id": locked.id,
+                            "order_id": locked.order.id,
+                            "ref_id": locked.ref_id,
+                        },
+                    )
+                else:
+                    OrderService.update_status_after_success_payment(
+                        locked.order
+                    )
+        return locked.status
+
+    def run(self, max_batches=20):
+        stats = {"checked": 0, "succeeded": 0, "failed": 0}
+        after_id = 0
+
+        for _ in range(max_batches):
+            payments = self.get_batch(after_id)
+            if not payments:
+                break
+            after_id = payments[-1].id
+
+            started = time.monotonic()
+            for payment, result in self.verify_batch(payments):
+                status = self.apply_result(payment, result)
+                if status == PaymentStatusType.SUCCESS:
+                    stats["succeeded"] += 1
+                elif status == PaymentStatusType.FAILED:
+                    stats["failed"] += 1
+            stats["checked"] += len(payments)
+
+            payment_logger.info(
+                "Pending payments reconciled",
+                extra={
+                    "task_name": TaskName.PAYMENT_RECONCILE,
+                    "batch_size": len(payments),
+                    "duration_ms": round((time.monotonic() - started) * 1000),
+                    **stats,
+                },
+            )
+        return stats
@@ -3,6 +3,7 @@ import json
 
 from django.conf import settings
 
+from order.models import OrderModel
 from .models import PaymentModel, PaymentGateway, PaymentStatusType
 from .factories import PaymentFactoryCreator
 from core.constants import TaskName, LoggerName
@@ -10,6 +11,11 @@ from core.constants import TaskName, LoggerName
 payment_logger = logging.getLogger(LoggerName.PAYMENT)
 
 
+# 101 means the gateway already verified this authority, e.g. from the
+# reconciliation task before the user returned to the callback.
+VERIFIED_CODES = (100, 101)
+
+
 def _json_safe(data):
     return json.loads(json.dumps(data, default=str))
 
@@ -26,6 +32,10 @@ class PaymentService:
             order=order,
             description=description,
         )
+        # update() keeps the order's post_save (and its notifications)
+        # out of payment creation
+        OrderModel.objects.filter(id=order.id).update(latest_payment=payment)
+        order.latest_payment = payment
         payment_logger.info(
             "Payment created successfully",
             extra={
@@ -111,7 +121,10 @@ class PaymentService:
                 int(payment.amount), payment.authority_id
             )
 
-            if result.get("data") and result["data"].get("code") == 100:
+            if (
+                result.get("data")
+                and result["data"].get("code") in VERIFIED_CODES
+            ):
                 ref_id = result["data"].get("ref_id")
 
                 payment.ref_id = ref_id
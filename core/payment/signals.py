@@ -0,0 +1,10 @@
+from django.contrib.sites.models import Site
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .processors.zarinpal import clear_callback_url_cache
+
+
+@receiver([post_save, post_delete], sender=Site)
+def clear_payment_callback_url(sender, **kwargs):
+    clear_callback_url_cache()
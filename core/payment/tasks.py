@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from .reconciliation import PaymentReconciliationService
+
+
+@shared_task
+def reconcile_pending_payments():
+    return PaymentReconciliationService().run()
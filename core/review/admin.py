@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 
-from .models import ProductCommentModel, CommentStatus
+from .models import ProductCommentModel, ProductCommentVoteModel, CommentStatus
 
 
 @admin.register(ProductCommentModel)
@@ -54,3 +54,10 @@ class ProductCommentAdmin(admin.ModelAdmin):
     def reject_comments(self, request, queryset):
         updated = queryset.update(status=CommentStatus.REJECTED)
         self.message_user(request, f"{updated} کامنت با موفقیت رد شد.")
+
+
+@admin.register(ProductCommentVoteModel)
+class ProductCommentVoteAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "comment", "vote", "created_date")
+    list_filter = ("vote",)
+    raw_id_fields = ("user", "comment")
@@ -72,6 +72,10 @@ class ProductCommentModel(TimeStampedModel):
         ]
         indexes = [
             models.Index(fields=["product", "status", "parent"]),
+            models.Index(
+                fields=["product", "status", "parent", "created_date", "id"],
+                name="idx_comment_thread",
+            ),
             models.Index(fields=["status", "parent", "created_date"]),
             models.Index(fields=["user", "created_date"]),
         ]
@@ -80,3 +84,39 @@ class ProductCommentModel(TimeStampedModel):
 
     def __str__(self):
         return f"{self.user} - {self.text[:30]}"
+
+
+class CommentVoteType(models.IntegerChoices):
+    LIKE = 1, _("پسندیدن")
+    DISLIKE = 2, _("نپسندیدن")
+
+
+class ProductCommentVoteModel(TimeStampedModel):
+    comment = models.ForeignKey(
+        ProductCommentModel,
+        on_delete=models.CASCADE,
+        related_name="votes",
+        verbose_name=_("نظر"),
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="comment_votes",
+        verbose_name=_("کاربر"),
+    )
+    vote = models.PositiveSmallIntegerField(
+        choices=CommentVoteType.choices, verbose_name=_("رأی")
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["comment", "user"],
+                name="unique_vote_per_user_per_comment",
+            )
+        ]
+        verbose_name = _("رأی نظر")
+        verbose_name_plural = _("رأی‌های نظرات")
+
+    def __str__(self):
+        return f"{self.user} - {self.get_vote_display()}"
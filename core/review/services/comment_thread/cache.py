@@ -0,0 +1,23 @@
+from common.services.tiered_cache import KeyedTieredVersionedCache
+
+from .provider import CommentThreadProvider
+
+
+class CommentThreadCache(KeyedTieredVersionedCache):
+    """Per-product comment aggregates and the first page of the thread."""
+
+    key_template = "comment_thread:{object_id}"
+    version_key_template = "comment_thread_version:{object_id}"
+    timeout = 60 * 60 * 24
+    stats_name = "comment_thread"
+
+    def __init__(self, product_id, provider=None):
+        super().__init__(
+            product_id, provider or CommentThreadProvider(product_id)
+        )
+
+    def load(self):
+        return {
+            "stats": self.provider.get_stats(),
+            "first_page": self.provider.get_page(),
+        }
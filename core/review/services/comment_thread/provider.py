@@ -0,0 +1,104 @@
+from datetime import datetime
+
+from django.db.models import Count, Q
+from django.utils.encoding import force_bytes, force_str
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+from review.models import ProductCommentModel, CommentStatus
+
+
+def encode_cursor(comment):
+    return urlsafe_base64_encode(
+        force_bytes(f"{comment['created_date'].isoformat()}|{comment['id']}")
+    )
+
+
+def decode_cursor(cursor):
+    """Return `(created_date, id)` of a cursor; ValueError if malformed."""
+    try:
+        created_date, comment_id = force_str(
+            urlsafe_base64_decode(cursor)
+        ).split("|")
+        return datetime.fromisoformat(created_date), int(comment_id)
+    except (TypeError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+class CommentThreadProvider:
+    """
+    Approved comments of a product as root comments, newest first, paged
+    by a `(created_date, id)` keyset cursor. The replies of a page are
+    loaded in one batch.
+    """
+
+    page_size = 10
+    max_page_size = 50
+
+    def __init__(self, product_id):
+        self.product_id = product_id
+
+    def get_queryset(self):
+        return ProductCommentModel.objects.filter(
+            product_id=self.product_id, status=CommentStatus.APPROVED.value
+        ).select_related("user")
+
+    @staticmethod
+    def build_comment(comment):
+        return {
+            "id": comment.id,
+            "title": comment.title,
+            "text": comment.text,
+            "is_recommended": comment.is_recommended,
+            "created_date": comment.created_date,
+            "user_status_label": str(comment.user.get_status()["label"]),
+            "likes": comment.likes,
+            "dislikes": comment.dislikes,
+        }
+
+    def get_replies(self, root_ids):
+        replies = {root_id: [] for root_id in root_ids}
+        for reply in (
+            self.get_queryset()
+            .filter(parent_id__in=root_ids)
+            .order_by("created_date", "id")
+        ):
+            replies[reply.parent_id].append(self.build_comment(reply))
+        return replies
+
+    def get_page(self, cursor=None, page_size=None):
+        page_size = min(page_size or self.page_size, self.max_page_size)
+
+        roots = self.get_queryset().filter(parent__isnull=True)
+        if cursor:
+            created_date, comment_id = decode_cursor(cursor)
+            roots = roots.filter(
+                Q(created_date__lt=created_date)
+                | Q(created_date=created_date, id__lt=comment_id)
+            )
+        roots = list(roots.order_by("-created_date", "-id")[: page_size + 1])
+
+        has_next = len(roots) > page_size
+        roots = roots[:page_size]
+        replies = self.get_replies([root.id for root in roots])
+
+        comments = [
+            {
+                **self.build_comment(root),
+                "prefetched_replies": replies[root.id],
+            }
+            for root in roots
+        ]
+        return {
+            "comments": comments,
+            "has_next": has_next,
+            "next_cursor": encode_cursor(comments[-1]) if has_next else None,
+        }
+
+    def get_stats(self):
+        return ProductCommentModel.objects.filter(
+            product_id=self.product_id, status=CommentStatus.APPROVED.value
+        ).aggregate(
+            comments_count=Count("id"),
+            recommended_count=Count("id", filter=Q(is_recommended=True)),
+            not_recommended_count=Count("id", filter=Q(is_recommended=False)),
+        )
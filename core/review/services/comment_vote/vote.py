@@ -0,0 +1,83 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from review.models import (
+    ProductCommentModel,
+    ProductCommentVoteModel,
+    CommentVoteType,
+)
+from review.services.comment_thread.cache import CommentThreadCache
+
+
+class DuplicateVoteError(Exception):
+    pass
+
+
+class CommentVoteService:
+    """
+    One vote per (user, comment) in ProductCommentVoteModel. The comment
+    counters are moved with F() deltas as the last statement of the
+    transaction, so the comment row is never locked for a whole vote.
+    """
+
+    actions = {
+        "like": CommentVoteType.LIKE.value,
+        "dislike": CommentVoteType.DISLIKE.value,
+    }
+    counter_fields = {
+        CommentVoteType.LIKE.value: "likes",
+        CommentVoteType.DISLIKE.value: "dislikes",
+    }
+
+    @staticmethod
+    def _get_or_create_vote(user, comment_id, vote):
+        try:
+            with transaction.atomic():
+                return None, ProductCommentVoteModel.objects.create(
+                    user=user, comment_id=comment_id, vote=vote
+                )
+        except IntegrityError:
+            existing = ProductCommentVoteModel.objects.select_for_update().get(
+                user=user, comment_id=comment_id
+            )
+            return existing.vote, existing
+
+    @classmethod
+    def vote(cls, user, comment_id, action):
+        """
+        Register or switch the user's vote and return the new
+        `(previous_vote, likes, dislikes)`. Raises DuplicateVoteError for
+        a repeated vote and ProductCommentModel.DoesNotExist for an
+        unknown comment.
+        """
+        vote = cls.actions[action]
+        with transaction.atomic():
+            product_id = ProductCommentModel.objects.values_list(
+                "product_id", flat=True
+            ).get(id=comment_id)
+
+            previous_vote, vote_obj = cls._get_or_create_vote(
+                user, comment_id, vote
+            )
+            if previous_vote == vote:
+                raise DuplicateVoteError
+
+            field = cls.counter_fields[vote]
+            deltas = {field: F(field) + 1}
+            if previous_vote is not None:
+                vote_obj.vote = vote
+                vote_obj.save(update_fields=["vote", "updated_date"])
+                field = cls.counter_fields[previous_vote]
+                deltas[field] = F(field) - 1
+
+            ProductCommentModel.objects.filter(id=comment_id).update(**deltas)
+            likes, dislikes = ProductCommentModel.objects.values_list(
+                "likes", "dislikes"
+            ).get(id=comment_id)
+
+            # only the thread is refreshed: bumping the product detail
+            # version on every vote would keep the product page cold, so
+            # its counters may lag until the next detail invalidation
+            CommentThreadCache.invalidate_on_commit([product_id])
+
+        return previous_vote, likes, dislikes
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from shop.services.product_detail.cache import ProductDetailCache
+from .models import ProductCommentModel
+from .services.comment_thread.cache import CommentThreadCache
+
+
+@receiver([post_save, post_delete], sender=ProductCommentModel)
+def invalidate_product_comments(sender, instance, **kwargs):
+    CommentThreadCache.invalidate_on_commit([instance.product_id])
+    ProductDetailCache.invalidate_on_commit([instance.product_id])
@@ -1,6 +1,10 @@
 from django.urls import path
 
-from .views import ProductCommentCreateView, LikeOrDislikeProductCommentView
+from .views import (
+    ProductCommentCreateView,
+    LikeOrDislikeProductCommentView,
+    ProductCommentThreadView,
+)
 
 app_name = "review"
 
@@ -15,4 +19,9 @@ urlpatterns = [
         LikeOrDislikeProductCommentView.as_view(),
         name="like-or-dislike-product-comment",
     ),
+    path(
+        "product/<int:pk>/comments/",
+        ProductCommentThreadView.as_view(),
+        name="product-comment-thread",
+    ),
 ]
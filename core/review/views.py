@@ -6,11 +6,15 @@ from django.urls import reverse_lazy
 from django.views.generic import CreateView, View
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import JsonResponse
-from django.db import transaction
+from django.template.loader import render_to_string
 
 from common.mixins import CustomLoginRequiredMixin
 from .forms import ProductCommentForm
 from .models import ProductCommentModel
+from .services.comment_thread.cache import CommentThreadCache
+from .services.comment_thread.provider import CommentThreadProvider
+from .services.comment_vote.vote import CommentVoteService, DuplicateVoteError
+from shop.models import ProductModel, ProductStatusType
 from core.constants import TaskName, LoggerName
 
 apps_logger = logging.getLogger(LoggerName.APPS)
@@ -79,7 +83,16 @@ class LikeOrDislikeProductCommentView(View):
         comment_id = request.POST.get("comment_id")
         action = request.POST.get("action")
 
-        if not comment_id or action not in ["like", "dislike"]:
+        if not request.user.is_authenticated:
+            return JsonResponse(
+                {
+                    "status": "error",
+                    "message": "لطفا ابتدا وارد حساب کاربری خود شوید",
+                },
+                status=401,
+            )
+
+        if not comment_id or action not in CommentVoteService.actions:
             apps_logger.error(
                 "Invalid vote request",
                 extra={
@@ -95,109 +108,28 @@ class LikeOrDislikeProductCommentView(View):
             )
 
         try:
-            with transaction.atomic():
-                comment = ProductCommentModel.objects.select_for_update().get(
-                    id=comment_id
-                )
-
-                session_key = f"comment_vote_{comment_id}"
-                previous_action = request.session.get(session_key)
-
-                if previous_action == action:
-                    apps_logger.warning(
-                        "Duplicate vote attempt",
-                        extra={
-                            "task_name": TaskName.PRODUCT_COMMENT_VOTE_DUPLICATE,
-                            "user_id": request.user.id,
-                            "comment_id": comment.id,
-                            "action": action,
-                            "correlation_id": getattr(
-                                request, "correlation_id", None
-                            ),
-                        },
-                    )
-                    return JsonResponse(
-                        {
-                            "status": "error",
-                            "message": "شما قبلاً این عمل را انجام داده‌اید.",
-                        },
-                        status=400,
-                    )
-
-                if previous_action == "like" and action == "dislike":
-                    if comment.likes > 0:
-                        comment.likes -= 1
-                    comment.dislikes += 1
-                    apps_logger.info(
-                        "Vote switched from like to dislike",
-                        extra={
-                            "task_name": TaskName.PRODUCT_COMMENT_VOTE_SWITCH,
-                            "user_id": request.user.id,
-                            "comment_id": comment.id,
-                            "from_action": "like",
-                            "to_action": "dislike",
-                            "likes": comment.likes,
-                            "dislikes": comment.dislikes,
-                            "correlation_id": getattr(
-                                request, "correlation_id", None
-                            ),
-                        },
-                    )
-
-                elif previous_action == "dislike" and action == "like":
-                    if comment.dislikes > 0:
-                        comment.dislikes -= 1
-                    comment.likes += 1
-                    apps_logger.info(
-                        "Vote switched from dislike to like",
-                        extra={
-                            "task_name": TaskName.PRODUCT_COMMENT_VOTE_SWITCH,
-                            "user_id": request.user.id,
-                            "comment_id": comment.id,
-                            "from_action": "dislike",
-                            "to_action": "like",
-                            "likes": comment.likes,
-                            "dislikes": comment.dislikes,
-                            "correlation_id": getattr(
-                                request, "correlation_id", None
-                            ),
-                        },
-                    )
-
-                elif previous_action is None:
-                    if action == "like":
-                        comment.likes += 1
-                    else:
-                        comment.dislikes += 1
-                    apps_logger.info(
-                        "New vote registered",
-                        extra={
-                            "task_name": TaskName.PRODUCT_COMMENT_VOTE_NEW,
-                            "user_id": request.user.id,
-                            "comment_id": comment.id,
-                            "action": action,
-                            "likes": comment.likes,
-                            "dislikes": comment.dislikes,
-                            "correlation_id": getattr(
-                                request, "correlation_id", None
-                            ),
-                        },
-                    )
-
-                comment.save()
-                request.session[session_key] = action
-                request.session.modified = True
-
-                return JsonResponse(
-                    {
-                        "status": "success",
-                        "message": "رأی شما ثبت شد.",
-                        "likes": comment.likes,
-                        "dislikes": comment.dislikes,
-                    }
-                )
-
-        except ProductCommentModel.DoesNotExist:
+            previous_vote, likes, dislikes = CommentVoteService.vote(
+                request.user, comment_id, action
+            )
+        except DuplicateVoteError:
+            apps_logger.warning(
+                "Duplicate vote attempt",
+                extra={
+                    "task_name": TaskName.PRODUCT_COMMENT_VOTE_DUPLICATE,
+                    "user_id": request.user.id,
+                    "comment_id": comment_id,
+                    "action": action,
+                    "correlation_id": getattr(request, "correlation_id", None),
+                },
+            )
+            return JsonResponse(
+                {
+                    "status": "error",
+                    "message": "شما قبلاً این عمل را انجام داده‌اید.",
+                },
+                status=400,
+            )
+        except (ProductCommentModel.DoesNotExist, ValueError):
             apps_logger.error(
                 "Vote failed: comment not found",
                 extra={
@@ -211,3 +143,93 @@ class LikeOrDislikeProductCommentView(View):
             return JsonResponse(
                 {"status": "error", "message": "کامنت یافت نشد."}, status=404
             )
+
+        if previous_vote is None:
+            apps_logger.info(
+                "New vote registered",
+                extra={
+                    "task_name": TaskName.PRODUCT_COMMENT_VOTE_NEW,
+                    "user_id": request.user.id,
+                    "comment_id": comment_id,
+                    "action": action,
+                    "likes": likes,
+                    "dislikes": dislikes,
+                    "correlation_id": getattr(request, "correlation_id", None),
+                },
+            )
+        else:
+            apps_logger.info(
+                "Vote switched",
+                extra={
+                    "task_name": TaskName.PRODUCT_COMMENT_VOTE_SWITCH,
+                    "user_id": request.user.id,
+                    "comment_id": comment_id,
+                    "to_action": action,
+                    "likes": likes,
+                    "dislikes": dislikes,
+                    "correlation_id": getattr(request, "correlation_id", None),
+                },
+            )
+
+        return JsonResponse(
+            {
+                "status": "success",
+                "message": "رأی شما ثبت شد.",
+                "likes": likes,
+                "dislikes": dislikes,
+            }
+        )
+
+
+class ProductCommentThreadView(View):
+    template_name = "includes/product-comments.html"
+
+    def get(self, request, *args, **kwargs):
+        product_id = kwargs.get("pk")
+        cursor = request.GET.get("cursor")
+
+        if not ProductModel.objects.filter(
+            id=product_id, status=ProductStatusType.PUBLISH.value
+        ).exists():
+            return JsonResponse(
+                {"error": "Product not found or not available"}, status=404
+            )
+
+        try:
+            page_size = int(request.GET.get("page_size", 0)) or None
+            thread = CommentThreadCache(product_id).get()
+            if cursor or page_size:
+                page = CommentThreadProvider(product_id).get_page(
+                    cursor=cursor, page_size=page_size
+                )
+            else:
+                page = thread["first_page"]
+        except ValueError:
+            apps_logger.warning(
+                "Invalid comment thread request",
+                extra={
+                    "task_name": TaskName.PRODUCT_COMMENT_THREAD,
+                    "product_id": product_id,
+                    "cursor": cursor,
+                    "correlation_id": getattr(request, "correlation_id", None),
+                },
+            )
+            return JsonResponse(
+                {"status": "error", "message": "پارامترهای نامعتبر."},
+                status=400,
+            )
+
+        return JsonResponse(
+            {
+                "status": "success",
+                "stats": thread["stats"],
+                "comments": page["comments"],
+                "has_next": page["has_next"],
+                "next_cursor": page["next_cursor"],
+                "html": render_to_string(
+                    self.template_name,
+                    {"comments": page["comments"]},
+                    request=request,
+                ),
+            }
+        )
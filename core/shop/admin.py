@@ -13,6 +13,7 @@ from .models import (
     ProductVariantModel,
     ProductImageModel,
     SearchLogModel,
+    SearchQueryStatModel,
 )
 
 
@@ -209,3 +210,13 @@ class SearchLogAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+
+@admin.register(SearchQueryStatModel)
+class SearchQueryStatAdmin(admin.ModelAdmin):
+    list_display = ("query", "date", "count")
+    list_filter = ("date",)
+    search_fields = ("query",)
+    date_hierarchy = "date"
+    ordering = ("-date", "-count")
+    list_per_page = 25
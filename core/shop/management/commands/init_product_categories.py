@@ -4,7 +4,7 @@ from django.utils.text import slugify
 
 
 from shop.models import ProductCategoryModel
-from shop.services.category.cache import CategoryCache
+from shop.services.category.cache import CategoryCache, CategoryIndexCache
 from shop.services.category.provider import CategoryProvider
 
 
@@ -448,6 +448,7 @@ class Command(BaseCommand):
 
         cache_manager = CategoryCache(CategoryProvider())
         cache_manager.invalidate()
+        CategoryIndexCache.invalidate()
 
         self.stdout.write(
             self.style.SUCCESS(
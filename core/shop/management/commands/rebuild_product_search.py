@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from shop.services.search.engine import ProductSearchEngine
+
+
+class Command(BaseCommand):
+    help = "Backfill the full-text search vector of all products"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of products loaded per batch",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        self.stdout.write("Rebuilding product search vectors...")
+        updated = ProductSearchEngine().rebuild_all(batch_size=batch_size)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\nCompleted!" f"\n• Products indexed: {updated}"
+            )
+        )
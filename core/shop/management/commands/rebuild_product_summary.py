@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from shop.services.product_summary.refresh import ProductSummaryService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized price/stock summary of all products"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of products refreshed per query batch",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        self.stdout.write("Rebuilding product summaries...")
+        updated = ProductSummaryService.rebuild_all(batch_size=batch_size)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\nCompleted!" f"\n• Products refreshed: {updated}"
+            )
+        )
@@ -4,13 +4,15 @@ from datetime import timedelta
 
 
 class SearchLogQuerySet(models.QuerySet):
-    def get_popular_searches(self):
-        from .models import SearchLogModel
+    def get_popular_searches(self, days=30, limit=10):
+        from .models import SearchQueryStatModel
 
+        since = timezone.localdate() - timedelta(days=days)
         return (
-            SearchLogModel.objects.values("query")
-            .annotate(count=models.Count("id"))
-            .order_by("-count")[:10]
+            SearchQueryStatModel.objects.filter(date__gte=since)
+            .values("query")
+            .annotate(count=models.Sum("count"))
+            .order_by("-count")[:limit]
         )
 
 
@@ -18,5 +20,5 @@ class SearchLogManager(models.Manager):
     def get_queryset(self):
         return SearchLogQuerySet(self.model, using=self._db)
 
-    def get_popular_searches(self):
-        return self.get_queryset().get_popular_searches()
+    def get_popular_searches(self, days=30, limit=10):
+        return self.get_queryset().get_popular_searches(days, limit)
@@ -1,5 +1,7 @@
 from django.db import models
 from django.db.models import Q
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from mptt.models import MPTTModel, TreeForeignKey
 from django.utils.text import slugify
 from django.core.validators import MaxValueValidator, MinValueValidator
@@ -80,6 +82,30 @@ class ProductModel(TimeStampedModel):
     total_sold = models.PositiveIntegerField(
         default=0, verbose_name=_("تعداد فروش")
     )
+    min_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=0,
+        null=True,
+        blank=True,
+        verbose_name=_("کمترین قیمت"),
+    )
+    min_final_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=0,
+        null=True,
+        blank=True,
+        verbose_name=_("قیمت نهایی ارزان‌ترین تنوع"),
+    )
+    min_price_discount_percent = models.PositiveIntegerField(
+        default=0, verbose_name=_("درصد تخفیف ارزان‌ترین تنوع")
+    )
+    in_stock = models.BooleanField(default=False, verbose_name=_("موجود"))
+    total_stock = models.PositiveIntegerField(
+        default=0, verbose_name=_("موجودی کل")
+    )
+    search_vector = SearchVectorField(
+        null=True, editable=False, verbose_name=_("بردار جستجو")
+    )
     published_date = models.DateTimeField(verbose_name=_("تاریخ انتشار"))
 
     class Meta:
@@ -90,6 +116,17 @@ class ProductModel(TimeStampedModel):
                 name="idx_slug_pub",
                 condition=Q(status=ProductStatusType.PUBLISH.value),
             ),
+            models.Index(
+                fields=["min_price"],
+                name="idx_product_listing_price",
+                condition=Q(
+                    status=ProductStatusType.PUBLISH.value, in_stock=True
+                ),
+            ),
+            models.Index(
+                fields=["status", "in_stock"], name="idx_product_in_stock"
+            ),
+            GinIndex(fields=["search_vector"], name="idx_product_search"),
         ]
         verbose_name = _("محصول")
         verbose_name_plural = _("محصولات")
@@ -170,6 +207,12 @@ class ProductFeatureModel(models.Model):
                 fields=["product", "feature"], name="unique_product_feature"
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["feature", "option", "product"],
+                name="idx_feature_option_product",
+            ),
+        ]
         verbose_name = _("ویژگی محصول")
         verbose_name_plural = _("ویژگی‌های محصول")
 
@@ -295,3 +338,26 @@ class SearchLogModel(TimeStampedModel):
 
     def __str__(self):
         return self.query
+
+
+class SearchQueryStatModel(models.Model):
+    query = models.CharField(max_length=255, verbose_name=_("عبارت جستجو"))
+    date = models.DateField(verbose_name=_("تاریخ"))
+    count = models.PositiveIntegerField(
+        default=0, verbose_name=_("تعداد جستجو")
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["query", "date"], name="unique_search_query_date"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["date"], name="idx_search_stat_date"),
+        ]
+        verbose_name = _("آمار روزانه جستجو")
+        verbose_name_plural = _("آمار روزانه جستجوها")
+
+    def __str__(self):
+        return f"{self.query} ({self.date}): {self.count}"
@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+from common.services.redis_client import get_redis_client
+from shop.models import ProductModel, ProductStatusType
+
+
+class BestSellerRanking:
+    day_key_template = "best_sellers:day:{date}"
+    window_key_template = "best_sellers:window:{days}"
+    day_key_timeout = 60 * 60 * 24 * 32
+    window_key_timeout = 60 * 5
+    # top ids are over-fetched so unpublished or out of stock products
+    # filtered out below still leave `limit` products in the rail
+    overfetch_factor = 2
+
+    def __init__(self, client=None):
+        self.client = client or get_redis_client()
+
+    def _day_key(self, date):
+        return self.day_key_template.format(date=date.isoformat())
+
+    def record(self, sales):
+        if not sales:
+            return
+        key = self._day_key(timezone.localdate())
+        pipe = self.client.pipeline()
+        for product_id, quantity in sales.items():
+            pipe.zincrby(key, quantity, product_id)
+        pipe.expire(key, self.day_key_timeout)
+        pipe.execute()
+
+    def top_ids(self, days=7, limit=10):
+        window_key = self.window_key_template.format(days=days)
+        if not self.client.exists(window_key):
+            today = timezone.localdate()
+            day_keys = [
+                self._day_key(today - timedelta(days=offset))
+                for offset in range(days)
+            ]
+            pipe = self.client.pipeline()
+            pipe.zunionstore(window_key, day_keys)
+            pipe.expire(window_key, self.window_key_timeout)
+            pipe.execute()
+
+        return [
+            int(product_id)
+            for product_id in self.client.zrevrange(window_key, 0, limit - 1)
+        ]
+
+    def top_products(self, days=7, limit=10):
+        product_ids = self.top_ids(days, limit * self.overfetch_factor)
+        if not product_ids:
+            return ProductModel.objects.none()
+
+        preserved = Case(
+            *[When(pk=pk, then=pos) for pos, pk in enumerate(product_ids)]
+        )
+        return ProductModel.objects.filter(
+            pk__in=product_ids,
+            status=ProductStatusType.PUBLISH.value,
+            in_stock=True,
+        ).order_by(preserved)[:limit]
+
+
+class ProductSalesService:
+    @staticmethod
+    def record_sales(sales):
+        sales = {pid: qty for pid, qty in sales.items() if qty}
+        if not sales:
+            return 0
+
+        return ProductModel.objects.filter(id__in=sales).update(
+            total_sold=F("total_sold")
+            + Case(
+                *[
+                    When(id=product_id, then=Value(quantity))
+                    for product_id, quantity in sales.items()
+                ],
+                default=Value(0),
+            )
+        )
@@ -1,33 +1,35 @@
-from django.core.cache import cache
+from common.services.tiered_cache import TieredVersionedCache
+from core.constants import TaskName
 
-from .provider import CategoryProvider
+from .index import CategoryIndex
+from .provider import CategoryIndexProvider
 
 
-class CategoryCache:
-    category_key = "categories_tree"
+class CategoryCache(TieredVersionedCache):
+    key = "categories_tree"
     version_key = "categories_version"
+    invalidate_on = ("shop.ProductCategoryModel",)
+    invalidate_task_name = TaskName.CATEGORY_CACHE_INVALIDATE
 
-    def __init__(self, provider):
-        self.provider = provider
-        self._initialize_version()
+    def load(self):
+        return self.provider.get_all()
 
-    def _initialize_version(self):
-        if not cache.has_key(self.version_key):
-            cache.set(self.version_key, 1)
 
-    def get(self):
-        version = cache.get(self.version_key, 1)
-        key = f"{self.category_key}_v{version}"
-        categories = cache.get(key)
+class CategoryIndexCache(TieredVersionedCache):
+    key = "category_index"
+    version_key = "category_index_version"
+    invalidate_on = (
+        "shop.ProductCategoryModel",
+        "shop.CategoryFeatureModel",
+        "shop.FeatureOptionModel",
+    )
+    invalidate_task_name = TaskName.CATEGORY_CACHE_INVALIDATE
 
-        if categories is None:
-            categories = self.provider.get_all()
-            cache.set(key, categories, None)
+    def __init__(self, provider=None):
+        super().__init__(provider or CategoryIndexProvider())
 
-        return categories
+    def load(self):
+        return self.provider.get_index()
 
-    def invalidate(self):
-        try:
-            cache.incr(self.version_key)
-        except ValueError:
-            cache.set(self.version_key, 2)
+    def get_index(self):
+        return CategoryIndex(self.get())
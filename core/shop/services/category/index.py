@@ -0,0 +1,24 @@
+class CategoryIndex:
+    """Read helpers over the dict built by CategoryIndexProvider."""
+
+    def __init__(self, index):
+        self.nodes = index["nodes"]
+        self.root_ids = index["root_ids"]
+        self.by_slug = index["by_slug"]
+        self.feature_map = index["features"]
+
+    def get(self, slug):
+        node_id = self.by_slug.get(slug)
+        return self.nodes[node_id] if node_id is not None else None
+
+    def root_nodes(self):
+        return [self.nodes[node_id] for node_id in self.root_ids]
+
+    def children(self, node):
+        return [self.nodes[node_id] for node_id in node["children_ids"]]
+
+    def descendant_ids(self, node):
+        return node["descendant_ids"]
+
+    def features(self, node):
+        return [self.feature_map[fid] for fid in node["feature_ids"]]
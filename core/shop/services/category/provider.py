@@ -1,6 +1,12 @@
+from collections import defaultdict
+
 from django.db.models import Prefetch
 from mptt.templatetags.mptt_tags import cache_tree_children
-from shop.models import ProductCategoryModel
+from shop.models import (
+    ProductCategoryModel,
+    CategoryFeatureModel,
+    FeatureOptionModel,
+)
 
 
 class CategoryProvider:
@@ -17,3 +23,67 @@ class CategoryProvider:
         ).all()
 
         return cache_tree_children(queryset)
+
+
+class CategoryIndexProvider:
+    """
+    Flat, picklable index of the category tree: nodes by id with their
+    children, descendant ids (self included) and leaf flag, a slug
+    lookup, and the features and options of each category.
+    """
+
+    def get_features(self):
+        features = {}
+        feature_ids_by_category = defaultdict(list)
+        for feature in CategoryFeatureModel.objects.prefetch_related(
+            Prefetch(
+                "options", queryset=FeatureOptionModel.objects.order_by("id")
+            )
+        ).order_by("id"):
+            features[feature.id] = {
+                "id": feature.id,
+                "name": feature.name,
+                "options": [
+                    {"id": option.id, "value": option.value}
+                    for option in feature.options.all()
+                ],
+            }
+            feature_ids_by_category[feature.category_id].append(feature.id)
+        return features, feature_ids_by_category
+
+    def get_index(self):
+        features, feature_ids_by_category = self.get_features()
+
+        nodes = {}
+        root_ids = []
+        for category in ProductCategoryModel.objects.order_by(
+            "tree_id", "lft"
+        ).values("id", "name", "slug", "parent_id", "level"):
+            nodes[category["id"]] = {
+                **category,
+                "children_ids": [],
+                "feature_ids": feature_ids_by_category[category["id"]],
+            }
+            if category["parent_id"] is None:
+                root_ids.append(category["id"])
+            else:
+                nodes[category["parent_id"]]["children_ids"].append(
+                    category["id"]
+                )
+
+        # children come after their parent in tree order, so walking it
+        # backwards fills every child before the parent needs it
+        for node in reversed(list(nodes.values())):
+            node["is_leaf"] = not node["children_ids"]
+            node["descendant_ids"] = [node["id"]]
+            for child_id in node["children_ids"]:
+                node["descendant_ids"].extend(
+                    nodes[child_id]["descendant_ids"]
+                )
+
+        return {
+            "nodes": nodes,
+            "root_ids": root_ids,
+            "by_slug": {node["slug"]: node["id"] for node in nodes.values()},
+            "features": features,
+        }
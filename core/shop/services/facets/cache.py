@@ -0,0 +1,69 @@
+import hashlib
+
+from django.core.cache import cache
+
+from .engine import FacetEngine
+
+
+class FacetCountCache:
+    """
+    Option counts per (category, filter signature, excluded feature) in
+    the shared cache.
+    Product and product feature edits bump a global version; stock
+    driven changes to the result set age out with the timeout.
+    """
+
+    key_template = "facet_counts:{version}:{signature}"
+    version_key = "facet_counts_version"
+    timeout = 60 * 10
+    ignored_params = ("page", "order_by")
+
+    def __init__(self, params, engine=None):
+        self.params = params
+        self.engine = engine or FacetEngine()
+
+    def signature(self, feature_ids, excluded=None):
+        items = sorted(
+            (key, value)
+            for key, values in self.params.lists()
+            if key not in self.ignored_params
+            for value in values
+        )
+        raw = repr((items, sorted(feature_ids), excluded))
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    def get(self, queryset, feature_ids):
+        """
+        Option counts for `feature_ids` over `queryset`, which must not
+        have the feature selections applied yet.
+        """
+        selected = self.engine.selected_features(self.params)
+        version = cache.get_or_set(self.version_key, 1, None)
+        keys = {
+            self.key_template.format(
+                version=version,
+                signature=self.signature(group_ids, excluded),
+            ): (excluded, group_ids)
+            for excluded, group_ids in self.engine.facet_groups(
+                feature_ids, selected
+            )
+        }
+
+        cached = cache.get_many(list(keys))
+        counts = {}
+        for key, (excluded, group_ids) in keys.items():
+            group_counts = cached.get(key)
+            if group_counts is None:
+                group_counts = self.engine.count_options(
+                    queryset, group_ids, selected, excluded
+                )
+                cache.set(key, group_counts, self.timeout)
+            counts.update(group_counts)
+        return counts
+
+    @classmethod
+    def invalidate(cls):
+        try:
+            cache.incr(cls.version_key)
+        except ValueError:
+            cache.set(cls.version_key, 2, None)
@@ -0,0 +1,88 @@
+from django.db.models import Count, Q
+
+from shop.models import ProductFeatureModel
+
+
+class FacetEngine:
+    """
+    Feature facets of a product result set.
+
+    Counts are disjunctive: one grouped query over ProductFeatureModel per
+    count group (see `facet_groups`), restricted to the product ids that
+    the other selections leave. Selected facets are matched with one
+    grouped subquery as well: a product qualifies when it matches as many
+    distinct selected features as were selected, i.e. the intersection
+    of the per-feature product sets.
+    """
+
+    feature_prefix = "feature_"
+
+    @classmethod
+    def selected_features(cls, params):
+        selected = {}
+        for key, values in params.lists():
+            if not key.startswith(cls.feature_prefix):
+                continue
+            feature_id = key[len(cls.feature_prefix) :]
+            values = [v for v in values if v.strip()]
+            if feature_id.isdigit() and values:
+                selected[int(feature_id)] = values
+        return selected
+
+    @staticmethod
+    def matching_product_ids(selected):
+        condition = Q()
+        for feature_id, values in selected.items():
+            condition |= Q(feature_id=feature_id) & (
+                Q(option__value__in=values) | Q(value__in=values)
+            )
+        return (
+            ProductFeatureModel.objects.filter(condition)
+            .values("product_id")
+            .annotate(matched=Count("feature_id", distinct=True))
+            .filter(matched=len(selected))
+            .values("product_id")
+        )
+
+    def filter_selected(self, queryset, selected):
+        if not selected:
+            return queryset
+        return queryset.filter(id__in=self.matching_product_ids(selected))
+
+    def filter(self, queryset, params):
+        return self.filter_selected(queryset, self.selected_features(params))
+
+    @staticmethod
+    def facet_groups(feature_ids, selected):
+        """
+        Split the features into count groups as `(excluded, feature_ids)`.
+        Unselected features are counted together over the result of all
+        selections; a selected feature is counted over the result of
+        every selection but its own, so its other options keep a count.
+        """
+        unselected = [fid for fid in feature_ids if fid not in selected]
+        groups = [(None, unselected)] if unselected else []
+        groups.extend((fid, [fid]) for fid in feature_ids if fid in selected)
+        return groups
+
+    def count_options(self, queryset, feature_ids, selected, excluded=None):
+        """
+        Return `{option_id: product count}` for the given features over
+        `queryset` narrowed by every selection except `excluded`'s.
+        """
+        if not feature_ids:
+            return {}
+        queryset = self.filter_selected(
+            queryset,
+            {fid: v for fid, v in selected.items() if fid != excluded},
+        )
+        rows = (
+            ProductFeatureModel.objects.filter(
+                product_id__in=queryset.order_by().values("id"),
+                feature_id__in=feature_ids,
+                option__isnull=False,
+            )
+            .values("option_id")
+            .annotate(count=Count("product_id", distinct=True))
+        )
+        return {row["option_id"]: row["count"] for row in rows}
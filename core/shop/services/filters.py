@@ -1,24 +1,22 @@
-from django.db.models import (
-    Q,
-    Exists,
-    OuterRef,
-    Subquery,
-    ExpressionWrapper,
-    DecimalField,
-    F,
-)
-from django.db.models.functions import Round
+from django.db.models import F
 
 from common.services.base_filters import BaseFilter
-from shop.models import (
-    ProductFeatureModel,
-    ProductCategoryModel,
-    ProductVariantModel,
-    ProductStatusType,
-)
+from shop.models import ProductStatusType
+from shop.services.category.cache import CategoryIndexCache
+from shop.services.facets.engine import FacetEngine
+from shop.services.search.engine import ProductSearchEngine
 
 
 class ProductFilter(BaseFilter):
+    search_engine_class = ProductSearchEngine
+    facet_engine_class = FacetEngine
+    order_fields = {
+        "-created_date": "-created_date",
+        "-total_sold": "-total_sold",
+        "-price": "-min_price",
+        "price": "min_price",
+    }
+
     def _get_filter_methods(self):
         return [
             self._filter_base_conditions,
@@ -30,84 +28,54 @@ class ProductFilter(BaseFilter):
             self._order,
         ]
 
-    def _filter_base_conditions(self, queryset):
-        queryset = queryset.annotate(
-            has_variant=Exists(
-                ProductVariantModel.objects.filter(
-                    product=OuterRef("pk"), stock__gt=0
-                )
-            )
-        ).filter(status=ProductStatusType.PUBLISH.value, has_variant=True)
+    def apply_without_features(self, queryset):
+        """
+        The result set before feature selections and ordering, which the
+        facet counts start from.
+        """
+        for filter_method in self._get_filter_methods():
+            if filter_method not in (self._filter_by_features, self._order):
+                queryset = filter_method(queryset)
         return queryset
 
+    def _filter_base_conditions(self, queryset):
+        return queryset.filter(
+            status=ProductStatusType.PUBLISH.value, in_stock=True
+        )
+
     def _filter_by_features(self, queryset):
-        for key, values in self.params.lists():
-            if key.startswith("feature_"):
-                feature_id = key.split("_", 1)[1]
-                values = [v for v in values if v.strip()]
-                if not values:
-                    continue
-                subquery = ProductFeatureModel.objects.filter(
-                    product_id=OuterRef("id"), feature_id=feature_id
-                ).filter(Q(option__value__in=values) | Q(value__in=values))
-                queryset = queryset.annotate(
-                    **{f"has_feature_{feature_id}": Exists(subquery)}
-                ).filter(**{f"has_feature_{feature_id}": True})
-        return queryset
+        return self.facet_engine_class().filter(queryset, self.params)
 
     def _filter_by_search(self, queryset):
         if q := self.params.get("q"):
-            queryset = queryset.filter(
-                Q(name__icontains=q) | Q(description__icontains=q)
-            )
+            queryset = self.search_engine_class().search(queryset, q)
         return queryset
 
     def _filter_by_price(self, queryset):
         if min_price := self.params.get("min_price"):
-            queryset = queryset.filter(price__gte=min_price)
+            queryset = queryset.filter(min_price__gte=min_price)
         if max_price := self.params.get("max_price"):
-            queryset = queryset.filter(price__lte=max_price)
+            queryset = queryset.filter(min_price__lte=max_price)
         return queryset
 
     def _filter_by_category(self, queryset):
         if slug := self.params.get("category_slug"):
-            try:
-                cat = ProductCategoryModel.objects.get(slug=slug)
-                subtree = cat.get_descendants(include_self=True)
-                queryset = queryset.filter(category__in=subtree)
-            except ProductCategoryModel.DoesNotExist:
-                pass
+            index = CategoryIndexCache().get_index()
+            if node := index.get(slug):
+                queryset = queryset.filter(
+                    category_id__in=index.descendant_ids(node)
+                )
         return queryset
 
     def _order(self, queryset):
         order_by = self.params.get("order_by")
-        if order_by and order_by in [
-            "-created_date",
-            "-total_sold",
-            "-price",
-            "price",
-        ]:
-            return queryset.order_by(order_by)
+        if order_by in self.order_fields:
+            return queryset.order_by(self.order_fields[order_by])
         return queryset
 
     def _annotate_variant_fields(self, queryset):
-        lowest_variant = (
-            ProductVariantModel.objects.filter(product=OuterRef("pk"))
-            .order_by("price")
-            .annotate(
-                final_price_calc=ExpressionWrapper(
-                    F("price") * (100 - F("discount_percent")) / 100,
-                    output_field=DecimalField(),
-                )
-            )
-            .annotate(final_price_calc=Round(F("final_price_calc"), 2))
-            .values("price", "discount_percent", "final_price_calc")[:1]
-        )
-
         return queryset.annotate(
-            price=Subquery(lowest_variant.values("price")),
-            discount_percent=Subquery(
-                lowest_variant.values("discount_percent")
-            ),
-            final_price=Subquery(lowest_variant.values("final_price_calc")),
+            price=F("min_price"),
+            discount_percent=F("min_price_discount_percent"),
+            final_price=F("min_final_price"),
         )
@@ -0,0 +1,26 @@
+from common.services.tiered_cache import KeyedTieredVersionedCache
+
+from .provider import ProductDetailProvider
+
+
+class ProductDetailCache(KeyedTieredVersionedCache):
+    key_template = "product_detail:{object_id}"
+    version_key_template = "product_detail_version:{object_id}"
+    timeout = 60 * 60 * 24
+    stats_name = "product_detail"
+
+    def __init__(self, product_id, provider=None):
+        super().__init__(
+            product_id, provider or ProductDetailProvider(product_id)
+        )
+
+    def load(self):
+        return self.provider.get_detail()
+
+    def get_with_version(self):
+        """
+        The data and the version it was built for; the version keys the
+        rendered fragments so they expire together with the data.
+        """
+        data = self.get()
+        return self.served_version, data
@@ -0,0 +1,51 @@
+from shop.models import ProductFeatureModel, ProductImageModel
+from review.services.comment_thread.cache import CommentThreadCache
+
+
+class ProductDetailProvider:
+    """
+    Static parts of the product detail page as plain data: features,
+    extra images, comment aggregates and the first page of the comment
+    thread. Price and stock are not included, they are read from the
+    variant matrix on every request.
+    """
+
+    def __init__(self, product_id):
+        self.product_id = product_id
+
+    def get_features(self):
+        return [
+            {
+                "name": feature.feature.name,
+                "value": (
+                    feature.option.value if feature.option else feature.value
+                ),
+            }
+            for feature in ProductFeatureModel.objects.filter(
+                product_id=self.product_id
+            ).select_related("feature", "option")
+        ]
+
+    def get_extra_images(self):
+        return [
+            {"url": image.file.url}
+            for image in ProductImageModel.objects.filter(
+                product_id=self.product_id
+            )
+        ]
+
+    def get_comments(self):
+        thread = CommentThreadCache(self.product_id).get()
+        page = thread["first_page"]
+        return {
+            **thread["stats"],
+            "comments": page["comments"],
+            "comments_next_cursor": page["next_cursor"],
+        }
+
+    def get_detail(self):
+        return {
+            "product_features": self.get_features(),
+            "extra_images": self.get_extra_images(),
+            **self.get_comments(),
+        }
@@ -0,0 +1,83 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from shop.models import ProductModel, ProductVariantModel
+from shop.services.variant_matrix.cache import VariantMatrixCache
+from website.services.product_rail.cache import ProductRailCache
+
+
+class ProductSummaryService:
+    summary_fields = [
+        "min_price",
+        "min_final_price",
+        "min_price_discount_percent",
+        "in_stock",
+        "total_stock",
+    ]
+
+    @staticmethod
+    def build_summary(variants):
+        if not variants:
+            return {
+                "min_price": None,
+                "min_final_price": None,
+                "min_price_discount_percent": 0,
+                "in_stock": False,
+                "total_stock": 0,
+            }
+
+        cheapest = min(variants, key=lambda v: (v.price, v.id))
+        total_stock = sum(v.stock for v in variants)
+        return {
+            "min_price": cheapest.price,
+            "min_final_price": cheapest.final_price,
+            "min_price_discount_percent": cheapest.discount_percent or 0,
+            "in_stock": total_stock > 0,
+            "total_stock": total_stock,
+        }
+
+    @classmethod
+    def refresh(cls, product_ids):
+        product_ids = {pid for pid in product_ids if pid is not None}
+        if not product_ids:
+            return 0
+
+        variants_by_product = defaultdict(list)
+        for variant in ProductVariantModel.objects.filter(
+            product_id__in=product_ids
+        ).only("id", "product_id", "price", "discount_percent", "stock"):
+            variants_by_product[variant.product_id].append(variant)
+
+        products = []
+        for product in ProductModel.objects.filter(id__in=product_ids).only(
+            "id", *cls.summary_fields
+        ):
+            summary = cls.build_summary(variants_by_product[product.id])
+            for field, value in summary.items():
+                setattr(product, field, value)
+            products.append(product)
+
+        return ProductModel.objects.bulk_update(products, cls.summary_fields)
+
+    @classmethod
+    def refresh_after_bulk_stock_update(cls, product_ids):
+        """
+        Bulk stock updates bypass the save signals and the invalidate_on
+        receivers, so the summaries and the caches built on stock are
+        refreshed here.
+        """
+        updated = cls.refresh(product_ids)
+        VariantMatrixCache.invalidate_on_commit(product_ids)
+        transaction.on_commit(ProductRailCache.invalidate)
+        return updated
+
+    @classmethod
+    def rebuild_all(cls, batch_size=500):
+        product_ids = list(
+            ProductModel.objects.order_by("id").values_list("id", flat=True)
+        )
+        updated = 0
+        for start in range(0, len(product_ids), batch_size):
+            updated += cls.refresh(product_ids[start : start + batch_size])
+        return updated
@@ -0,0 +1,82 @@
+import re
+from collections import defaultdict
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db.models import F, TextField, Value
+from django.utils.html import strip_tags
+
+from shop.models import ProductModel, ProductFeatureModel
+
+
+class ProductSearchEngine:
+    # Persian has no PostgreSQL stemmer, so tokens are indexed as-is.
+    config = "simple"
+    term_pattern = re.compile(r"\w+", re.UNICODE)
+
+    def build_query(self, q):
+        terms = self.term_pattern.findall(q or "")
+        if not terms:
+            return None
+        raw_query = " & ".join(f"{term}:*" for term in terms)
+        return SearchQuery(raw_query, config=self.config, search_type="raw")
+
+    def search(self, queryset, q):
+        query = self.build_query(q)
+        if query is None:
+            return queryset
+
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "-created_date")
+        )
+
+    def _vector(self, text, weight):
+        return SearchVector(
+            Value(text, output_field=TextField()),
+            weight=weight,
+            config=self.config,
+        )
+
+    def update_vectors(self, product_ids):
+        product_ids = {pid for pid in product_ids if pid is not None}
+        if not product_ids:
+            return 0
+
+        feature_values = defaultdict(list)
+        for feature in ProductFeatureModel.objects.filter(
+            product_id__in=product_ids
+        ).select_related("option"):
+            value = feature.option.value if feature.option else feature.value
+            if value:
+                feature_values[feature.product_id].append(value)
+
+        updated = 0
+        for product in ProductModel.objects.filter(id__in=product_ids).only(
+            "id", "name", "name_en", "description"
+        ):
+            vector = (
+                self._vector(product.name, "A")
+                + self._vector(product.name_en, "A")
+                + self._vector(" ".join(feature_values[product.id]), "B")
+                + self._vector(strip_tags(product.description), "C")
+            )
+            updated += ProductModel.objects.filter(id=product.id).update(
+                search_vector=vector
+            )
+        return updated
+
+    def rebuild_all(self, batch_size=500):
+        product_ids = list(
+            ProductModel.objects.order_by("id").values_list("id", flat=True)
+        )
+        updated = 0
+        for start in range(0, len(product_ids), batch_size):
+            updated += self.update_vectors(
+                product_ids[start : start + batch_size]
+            )
+        return updated
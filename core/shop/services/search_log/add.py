@@ -1,7 +1,35 @@
-from shop.models import SearchLogModel
+import logging
+
+from redis import RedisError
+
+from .buffer import SearchLogBuffer
+from .recent import RecentSearchStore
+from core.constants import TaskName, LoggerName
+
+apps_logger = logging.getLogger(LoggerName.APPS)
+
+
+def normalize_query(query):
+    return " ".join(query.split()).lower()[:255]
 
 
 def add_search_log(query, user=None):
-    SearchLogModel.objects.get_or_create(
-        query=query, user=user if user and user.is_authenticated else None
-    )
+    query = normalize_query(query)
+    if not query:
+        return
+
+    user_id = user.id if user and user.is_authenticated else None
+    try:
+        SearchLogBuffer().push(query, user_id)
+        if user_id:
+            RecentSearchStore(user_id).add(query)
+    except RedisError as e:
+        apps_logger.warning(
+            "Search log event dropped",
+            extra={
+                "task_name": TaskName.SEARCH_LOG_ADD,
+                "query": query,
+                "user_id": user_id,
+                "error": str(e),
+            },
+        )
@@ -0,0 +1,34 @@
+import json
+
+from django.utils import timezone
+
+from common.services.redis_client import get_redis_client
+
+
+class SearchLogBuffer:
+    key = "search_log_buffer"
+
+    def __init__(self, client=None):
+        self.client = client or get_redis_client()
+
+    def push(self, query, user_id=None):
+        event = {
+            "query": query,
+            "user_id": user_id,
+            "timestamp": timezone.now().isoformat(),
+        }
+        self.client.rpush(self.key, json.dumps(event, ensure_ascii=False))
+
+    def pop_batch(self, size):
+        pipe = self.client.pipeline()
+        pipe.lrange(self.key, 0, size - 1)
+        pipe.ltrim(self.key, size, -1)
+        events, _ = pipe.execute()
+        return [json.loads(event) for event in events]
+
+    def requeue(self, events):
+        if events:
+            self.client.rpush(
+                self.key,
+                *[json.dumps(event, ensure_ascii=False) for event in events],
+            )
@@ -1,22 +1,14 @@
-from datetime import timedelta
-from django.core.cache import cache
-
-
+from common.services.tiered_cache import TieredVersionedCache
 from shop.models import SearchLogModel
 
 
-class PopularSearchCache:
-    cache_key = "popular_searches"
-
-    def get(self):
-        popular_searches = cache.get(self.cache_key)
-
-        if popular_searches is None:
-            popular_searches = SearchLogModel.objects.get_popular_searches()
-            cache.set(
-                self.cache_key,
-                popular_searches,
-                timedelta(days=2).total_seconds(),
-            )
+class PopularSearchCache(TieredVersionedCache):
+    key = "popular_searches"
+    version_key = "popular_searches_version"
+    local_timeout = 60
 
-        return popular_searches
+    def load(self):
+        return [
+            {"query": item["query"], "count": item["count"]}
+            for item in SearchLogModel.objects.get_popular_searches()
+        ]
@@ -0,0 +1,59 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from shop.models import SearchLogModel, SearchQueryStatModel
+from .buffer import SearchLogBuffer
+
+
+def flush_search_log_events(events):
+    daily_counts = Counter()
+    # repeated searches by the same user in one batch keep a single row
+    user_queries = {}
+
+    for event in events:
+        created = parse_datetime(event["timestamp"]) or timezone.now()
+        daily_counts[(event["query"], timezone.localdate(created))] += 1
+        if event.get("user_id"):
+            user_queries[(event["user_id"], event["query"])] = None
+
+    with transaction.atomic():
+        SearchQueryStatModel.objects.bulk_create(
+            [
+                SearchQueryStatModel(query=query, date=date)
+                for query, date in daily_counts
+            ],
+            ignore_conflicts=True,
+        )
+        for (query, date), count in daily_counts.items():
+            SearchQueryStatModel.objects.filter(query=query, date=date).update(
+                count=F("count") + count
+            )
+        SearchLogModel.objects.bulk_create(
+            [
+                SearchLogModel(user_id=user_id, query=query)
+                for user_id, query in user_queries
+            ]
+        )
+
+    return len(events)
+
+
+def flush_search_log_buffer(batch_size=1000, max_batches=20):
+    buffer = SearchLogBuffer()
+    flushed = 0
+
+    for _ in range(max_batches):
+        events = buffer.pop_batch(batch_size)
+        if not events:
+            break
+        try:
+            flushed += flush_search_log_events(events)
+        except Exception:
+            buffer.requeue(events)
+            raise
+
+    return flushed
@@ -0,0 +1,30 @@
+from common.services.redis_client import get_redis_client
+
+
+class RecentSearchStore:
+    key_template = "recent_searches:user:{user_id}"
+
+    def __init__(
+        self, user_id, limit=10, timeout=60 * 60 * 24 * 30, client=None
+    ):
+        self.key = self.key_template.format(user_id=user_id)
+        self.limit = limit
+        self.timeout = timeout
+        self.client = client or get_redis_client()
+
+    def add(self, query):
+        pipe = self.client.pipeline()
+        pipe.lrem(self.key, 0, query)
+        pipe.lpush(self.key, query)
+        pipe.ltrim(self.key, 0, self.limit - 1)
+        pipe.expire(self.key, self.timeout)
+        pipe.execute()
+
+    def get(self):
+        return [
+            {"query": query.decode("utf-8")}
+            for query in self.client.lrange(self.key, 0, self.limit - 1)
+        ]
+
+    def clear(self):
+        self.client.delete(self.key)
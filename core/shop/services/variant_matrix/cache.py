@@ -0,0 +1,51 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from .provider import VariantMatrixProvider, normalize_selection
+
+
+class VariantMatrixCache:
+    """
+    Per-product variant matrix in the shared cache only: stock changes
+    with every order, so a per-process copy would go stale too easily.
+    A missing product is cached as an empty marker to avoid repeated
+    lookups.
+    """
+
+    key_template = "variant_matrix:{product_id}"
+    timeout = 60 * 60
+    missing = {}
+
+    def __init__(self, product_id, provider=None):
+        self.product_id = product_id
+        self.provider = provider or VariantMatrixProvider()
+
+    @classmethod
+    def _key(cls, product_id):
+        return cls.key_template.format(product_id=product_id)
+
+    def get(self):
+        key = self._key(self.product_id)
+        matrix = cache.get(key)
+        if matrix is None:
+            matrix = self.provider.get_matrix(self.product_id)
+            cache.set(key, matrix or self.missing, self.timeout)
+        return matrix or None
+
+    def resolve(self, selection):
+        matrix = self.get()
+        if matrix is None:
+            return None, None
+        key = normalize_selection(selection, matrix["attributes"])
+        return matrix, matrix["variants"].get(key)
+
+    @classmethod
+    def invalidate_many(cls, product_ids):
+        keys = [cls._key(pid) for pid in set(product_ids) if pid is not None]
+        if keys:
+            cache.delete_many(keys)
+
+    @classmethod
+    def invalidate_on_commit(cls, product_ids):
+        product_ids = set(product_ids)
+        transaction.on_commit(lambda: cls.invalidate_many(product_ids))
@@ -0,0 +1,58 @@
+from shop.models import ProductModel, ProductStatusType, ProductVariantModel
+
+
+def normalize_selection(selection, attributes=None):
+    """
+    Build the matrix key of an attribute selection: `name=value` pairs
+    sorted by attribute name and joined with `&`. When `attributes` is
+    given, parameters that are not attributes of the product are dropped.
+    """
+    pairs = sorted(
+        (name, value)
+        for name, value in selection.items()
+        if attributes is None or name in attributes
+    )
+    return "&".join(f"{name}={value}" for name, value in pairs)
+
+
+class VariantMatrixProvider:
+    @staticmethod
+    def build_entry(variant):
+        return {
+            "variant_id": variant.id,
+            "stock": variant.stock,
+            "base_price": float(variant.price),
+            "final_price": variant.final_price,
+            "has_discount": variant.discount_percent > 0,
+            "discount_percent": variant.discount_percent,
+        }
+
+    def get_matrix(self, product_id):
+        if not ProductModel.objects.filter(
+            id=product_id, status=ProductStatusType.PUBLISH.value
+        ).exists():
+            return None
+
+        attributes = []
+        variants = {}
+        for variant in (
+            ProductVariantModel.objects.filter(product_id=product_id)
+            .select_related("attribute_value__attribute")
+            .order_by("id")
+        ):
+            # a variant carries one attribute value today; the key is
+            # still built as a combination so it holds for several
+            selection = {
+                variant.attribute_value.attribute.name: (
+                    variant.attribute_value.value
+                )
+            }
+            for name in selection:
+                if name not in attributes:
+                    attributes.append(name)
+            variants[normalize_selection(selection)] = {
+                **self.build_entry(variant),
+                "selection": selection,
+            }
+
+        return {"attributes": attributes, "variants": variants}
@@ -1,50 +1,60 @@
-import logging
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
-from .models import ProductCategoryModel
-from .services.category.provider import CategoryProvider
-from .services.category.cache import CategoryCache
-from core.constants import TaskName, LoggerName
+from .models import (
+    ProductModel,
+    ProductVariantModel,
+    ProductFeatureModel,
+    FeatureOptionModel,
+    ProductImageModel,
+)
 
-cache_manager = CategoryCache(CategoryProvider())
-apps_logger = logging.getLogger(LoggerName.APPS)
+# imported so the declarative invalidate_on receivers get connected
+from .services.category.cache import CategoryCache  # noqa: F401
+from .services.facets.cache import FacetCountCache
+from .services.product_detail.cache import ProductDetailCache
+from .services.product_summary.refresh import ProductSummaryService
+from .services.search.engine import ProductSearchEngine
+from .services.variant_matrix.cache import VariantMatrixCache
 
 
-@receiver([post_save, post_delete], sender=ProductCategoryModel)
-def clear_category_cache(sender, **kwargs):
-    instance = kwargs.get("instance", None)
-    created = kwargs.get("created", None)
+@receiver([post_save, post_delete], sender=ProductVariantModel)
+def refresh_product_summary(sender, instance, **kwargs):
+    ProductSummaryService.refresh([instance.product_id])
+    VariantMatrixCache.invalidate_on_commit([instance.product_id])
 
-    cache_manager.invalidate()
 
-    if created is True:
-        apps_logger.info(
-            "Category cache invalidated after category creation",
-            extra={
-                "task_name": TaskName.CATEGORY_CACHE_INVALIDATE,
-                "category_id": getattr(instance, "id", None),
-                "category_name": getattr(instance, "name", None),
-                "action": "created",
-            },
-        )
-    elif created is False:
-        apps_logger.info(
-            "Category cache invalidated after category update",
-            extra={
-                "task_name": TaskName.CATEGORY_CACHE_INVALIDATE,
-                "category_id": getattr(instance, "id", None),
-                "category_name": getattr(instance, "name", None),
-                "action": "updated",
-            },
-        )
-    else:
-        apps_logger.warning(
-            "Category cache invalidated after category deletion",
-            extra={
-                "task_name": TaskName.CATEGORY_CACHE_INVALIDATE,
-                "category_id": getattr(instance, "id", None),
-                "category_name": getattr(instance, "name", None),
-                "action": "deleted",
-            },
+@receiver(post_save, sender=ProductModel)
+def refresh_product_search_vector(sender, instance, **kwargs):
+    ProductSearchEngine().update_vectors([instance.id])
+    VariantMatrixCache.invalidate_on_commit([instance.id])
+    ProductDetailCache.invalidate_on_commit([instance.id])
+
+
+@receiver([post_save, post_delete], sender=ProductFeatureModel)
+def refresh_product_feature_search_vector(sender, instance, **kwargs):
+    ProductSearchEngine().update_vectors([instance.product_id])
+    ProductDetailCache.invalidate_on_commit([instance.product_id])
+
+
+@receiver(post_save, sender=FeatureOptionModel)
+def refresh_feature_option_search_vector(sender, instance, **kwargs):
+    product_ids = set(
+        ProductFeatureModel.objects.filter(option=instance).values_list(
+            "product_id", flat=True
         )
+    )
+    ProductSearchEngine().update_vectors(product_ids)
+    ProductDetailCache.invalidate_on_commit(product_ids)
+
+
+@receiver([post_save, post_delete], sender=ProductImageModel)
+def invalidate_product_detail_images(sender, instance, **kwargs):
+    ProductDetailCache.invalidate_on_commit([instance.product_id])
+
+
+@receiver([post_save, post_delete], sender=ProductModel)
+@receiver([post_save, post_delete], sender=ProductFeatureModel)
+def invalidate_facet_counts(sender, instance, **kwargs):
+    transaction.on_commit(FacetCountCache.invalidate)
@@ -0,0 +1,14 @@
+from celery import shared_task
+
+from .services.search_log.flush import flush_search_log_buffer
+from .services.search_log.cache import PopularSearchCache
+
+
+@shared_task
+def flush_search_logs():
+    return flush_search_log_buffer()
+
+
+@shared_task
+def refresh_popular_searches():
+    return len(PopularSearchCache().refresh())
@@ -1,15 +1,9 @@
 from django import template
-from django.db.models import Sum, Subquery, OuterRef
-from django.core.cache import cache
 
-from shop.models import (
-    ProductCategoryModel,
-    ProductModel,
-    ProductStatusType,
-    ProductVariantModel,
-)
-from order.models import OrderModel, OrderStatusType
+from shop.models import ProductCategoryModel
 from blog.models import PostModel
+from website.services.product_rail.cache import ProductRailCache
+from website.services.product_rail.provider import BestSellingProductsProvider
 
 register = template.Library()
 
@@ -50,32 +44,10 @@ def category():
 
 @register.inclusion_tag("includes/best-selling-products.html")
 def best_selling_products():
-    cached_data = cache.get("best_selling_products")
-    if cached_data:
-        return {"products": cached_data}
-
-    products = (
-        ProductModel.objects.filter(
-            status=ProductStatusType.PUBLISH,
-            variants__order_items__order__status=OrderStatusType.SUCCESS,
-        )
-        .prefetch_related(
-            "variants",
-        )
-        .order_by("-total_sold")[:10]
+    cache_manager = ProductRailCache(
+        "best_selling_products", BestSellingProductsProvider()
     )
-
-    for product in products:
-        variants = list(product.variants.all())
-        if variants:
-            product.cheapest_variant = min(
-                variants, key=lambda v: v.final_price
-            )
-        else:
-            product.cheapest_variant = None
-
-    cache.set("best_selling_products", products, 60 * 60 * 48)
-    return {"products": products}
+    return {"products": cache_manager.get()}
 
 
 @register.inclusion_tag("includes/posts.html")
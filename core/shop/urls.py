@@ -1,5 +1,10 @@
 from django.urls import path, re_path
-from .views import ProductListView, ProductDetailView, ProductVariantView
+from .views import (
+    ProductListView,
+    ProductDetailView,
+    ProductVariantView,
+    ProductVariantMatrixView,
+)
 
 
 app_name = "shop"
@@ -16,4 +21,9 @@ urlpatterns = [
         ProductVariantView.as_view(),
         name="product-variant",
     ),
+    path(
+        "product/<int:pk>/variants/",
+        ProductVariantMatrixView.as_view(),
+        name="product-variant-matrix",
+    ),
 ]
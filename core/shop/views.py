@@ -5,7 +5,6 @@ from django.db.models import (
     Q,
     Exists,
     OuterRef,
-    Prefetch,
     ExpressionWrapper,
     DecimalField,
 )
@@ -18,10 +17,8 @@ from .models import (
     ProductModel,
     ProductStatusType,
     ProductCategoryModel,
-    ProductVariantModel,
     CategoryFeatureModel,
     FeatureOptionModel,
-    ProductFeatureModel,
     AttributeValueModel,
     ProductImageModel,
 )
@@ -33,8 +30,8 @@ from .services.filters import ProductFilter
 from recently_viewed.services.recently_viewed_products import (
     RecentlyViewedProductsService,
 )
-from review.models import ProductCommentModel, CommentStatus
 from .services.search_log.add import add_search_log
+from .services.variant_matrix.cache import VariantMatrixCache
 from core.constants import TaskName, LoggerName
 
 
@@ -56,44 +53,27 @@ class ProductListView(ListView):
                 add_search_log(q, self.request.user)
                 self.request.session["last_search"] = q
 
-        base_queryset = ProductModel.objects.all()
-        return self.filter_class(self.request.GET).apply(base_queryset)
+        self.product_filter = self.filter_class(self.request.GET)
+        return self.product_filter.apply(ProductModel.objects.all())
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
         builder = self.context_builder_class(
-            request=self.request, base_context=context_data
+            request=self.request,
+            base_context=context_data,
+            facet_queryset=self.product_filter.apply_without_features(
+                ProductModel.objects.all()
+            ),
         )
         return builder.build()
 
 
 class ProductDetailView(DetailView):
-    queryset = (
-        ProductModel.objects.filter(status=ProductStatusType.PUBLISH.value)
-        .select_related("category")
-        .prefetch_related(
-            Prefetch(
-                "variants",
-                queryset=ProductVariantModel.objects.filter(
-                    stock__gt=0
-                ).select_related("attribute_value__attribute"),
-            ),
-            "product_images",
-            Prefetch(
-                "features",
-                queryset=ProductFeatureModel.objects.select_related(
-                    "feature", "option"
-                ),
-            ),
-            Prefetch(
-                "comments",
-                queryset=ProductCommentModel.objects.filter(
-                    status=CommentStatus.APPROVED.value
-                ).select_related("user"),
-                to_attr="prefetched_comments",
-            ),
-        )
-    )
+    # features, images, comments and variants come from the product
+    # detail and variant matrix caches in the context builder
+    queryset = ProductModel.objects.filter(
+        status=ProductStatusType.PUBLISH.value
+    ).select_related("category__parent__parent")
     template_name = "shop/product-detail.html"
     context_object_name = "product"
 
@@ -132,25 +112,10 @@ class ProductVariantView(View):
             },
         )
 
-        try:
-            product = ProductModel.objects.prefetch_related(
-                Prefetch(
-                    "variants",
-                    queryset=ProductVariantModel.objects.filter(
-                        stock__gt=0
-                    ).select_related("attribute_value__attribute"),
-                )
-            ).get(id=product_id, status=ProductStatusType.PUBLISH.value)
-            apps_logger.info(
-                "ProductVariantView: product retrieved successfully",
-                extra={
-                    "task_name": TaskName.PRODUCT_VARIANT,
-                    "product_id": product_id,
-                    "user_id": getattr(request.user, "id", None),
-                    "correlation_id": getattr(request, "correlation_id", None),
-                },
-            )
-        except ProductModel.DoesNotExist:
+        matrix, matched_variant = VariantMatrixCache(product_id).resolve(
+            selected_attrs
+        )
+        if matrix is None:
             apps_logger.error(
                 "ProductVariantView: product not found or not available",
                 extra={
@@ -164,50 +129,19 @@ class ProductVariantView(View):
                 {"error": "Product not found or not available"}, status=404
             )
 
-        matched_variant = None
-        for variant in product.variants.all():
-            attr_name = variant.attribute_value.attribute.name
-            attr_value = variant.attribute_value.value
-
-            if (
-                selected_attrs.get(attr_name) == attr_value
-                and len(selected_attrs) == 1
-            ):
-                matched_variant = variant
-                break
-
-        if matched_variant:
-            has_discount = matched_variant.discount_percent > 0
-            base_price = float(matched_variant.price)
-            final_price = matched_variant.final_price
-
+        if matched_variant and matched_variant["stock"] > 0:
             apps_logger.info(
                 "ProductVariantView: variant matched successfully",
                 extra={
                     "task_name": TaskName.PRODUCT_VARIANT,
                     "product_id": product_id,
-                    "variant_id": matched_variant.id,
-                    "stock": matched_variant.stock,
-                    "base_price": base_price,
-                    "final_price": final_price,
-                    "has_discount": has_discount,
-                    "discount_percent": matched_variant.discount_percent,
+                    **matched_variant,
                     "user_id": getattr(request.user, "id", None),
                     "correlation_id": getattr(request, "correlation_id", None),
                 },
             )
+            return JsonResponse({"success": True, **matched_variant})
 
-            return JsonResponse(
-                {
-                    "success": True,
-                    "variant_id": matched_variant.id,
-                    "stock": matched_variant.stock,
-                    "base_price": base_price,
-                    "final_price": final_price,
-                    "has_discount": has_discount,
-                    "discount_percent": matched_variant.discount_percent,
-                }
-            )
         apps_logger.warning(
             "ProductVariantView: no matching variant found",
             extra={
@@ -225,3 +159,14 @@ class ProductVariantView(View):
                 "message": "No matching variant found for the selected options.",
             }
         )
+
+
+class ProductVariantMatrixView(View):
+    def get(self, request, *args, **kwargs):
+        product_id = kwargs.get("pk")
+        matrix = VariantMatrixCache(product_id).get()
+        if matrix is None:
+            return JsonResponse(
+                {"error": "Product not found or not available"}, status=404
+            )
+        return JsonResponse({"success": True, **matrix})
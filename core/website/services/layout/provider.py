@@ -0,0 +1,100 @@
+from redis import RedisError
+from django.utils.functional import SimpleLazyObject
+
+from common.services.tiered_cache import TieredVersionedCache
+from cart.services.cart import LazyCartService
+from notifications.services.unread import get_unread_messages_count
+from pages.services.static_page.cache import StaticPageCache
+from pages.services.static_page.provider import StaticPageProvider
+from shop.services.category.cache import CategoryCache
+from shop.services.category.provider import CategoryProvider
+from shop.services.search_log.cache import PopularSearchCache
+from shop.services.search_log.recent import RecentSearchStore
+from website.services.site_info.cache import SiteInfoCache
+from website.services.site_info.provider import SiteInfoProvider
+from website.services.site_resource.cache import (
+    SiteResourceLicensesCache,
+    SiteResourceSocialsCache,
+)
+from website.services.site_resource.provider import (
+    SiteResourceLicensesProvider,
+    SiteResourceSocialsProvider,
+)
+
+
+class LayoutDataProvider:
+    """
+    Header/footer data shared by every page. Cached pieces are resolved
+    together with one cache `get_many` the first time any of them is
+    rendered; per-user pieces are evaluated only when used.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self._shared = None
+
+    def get_cache_managers(self):
+        return {
+            "categories": CategoryCache(CategoryProvider()),
+            "popular_searches": PopularSearchCache(),
+            "static_pages": StaticPageCache(StaticPageProvider()),
+            "site_info": SiteInfoCache(SiteInfoProvider()),
+            "site_resource_socials": SiteResourceSocialsCache(
+                SiteResourceSocialsProvider()
+            ),
+            "site_resource_licenses": SiteResourceLicensesCache(
+                SiteResourceLicensesProvider()
+            ),
+        }
+
+    def get_shared(self):
+        if self._shared is None:
+            managers = self.get_cache_managers()
+            values = TieredVersionedCache.get_many(list(managers.values()))
+            self._shared = dict(zip(managers, values))
+        return self._shared
+
+    def _lazy_shared(self, name):
+        return SimpleLazyObject(lambda: self.get_shared()[name])
+
+    def _is_authenticated(self):
+        return self.request.user.is_authenticated
+
+    def get_user(self):
+        return self.request.user if self._is_authenticated() else None
+
+    # templates iterate and compare these without an auth guard, so the
+    # fallbacks are an empty list and zero rather than None
+    def get_recent_searches(self):
+        if not self._is_authenticated():
+            return []
+        try:
+            return RecentSearchStore(self.request.user.id).get()
+        except RedisError:
+            return []
+
+    def get_new_messages_count(self):
+        if not self._is_authenticated():
+            return 0
+        return get_unread_messages_count(self.request.user)
+
+    def get_cart(self):
+        if not hasattr(self.request, "_lazy_cart"):
+            self.request._lazy_cart = LazyCartService(self.request)
+        return self.request._lazy_cart
+
+    def get_context(self):
+        context = {
+            name: self._lazy_shared(name) for name in self.get_cache_managers()
+        }
+        context.update(
+            {
+                "cart": self.get_cart(),
+                "user": SimpleLazyObject(self.get_user),
+                "recent_searches": SimpleLazyObject(self.get_recent_searches),
+                "new_messages_count": SimpleLazyObject(
+                    self.get_new_messages_count
+                ),
+            }
+        )
+        return context
@@ -0,0 +1,15 @@
+from common.services.tiered_cache import TieredVersionedCache
+
+
+class ProductRailCache(TieredVersionedCache):
+    version_key = "product_rails_version"
+    timeout = 60 * 60
+    local_timeout = 60
+    invalidate_on = ("shop.ProductModel", "shop.ProductVariantModel")
+
+    def __init__(self, key, provider=None):
+        super().__init__(provider)
+        self.key = key
+
+    def load(self):
+        return self.provider.get_all()
@@ -0,0 +1,63 @@
+from redis import RedisError
+
+from shop.models import ProductModel, ProductStatusType
+from shop.services.best_seller.ranking import BestSellerRanking
+
+
+class BaseProductRailProvider:
+    fields = (
+        "id",
+        "slug",
+        "name",
+        "image",
+        "min_price",
+        "min_final_price",
+        "min_price_discount_percent",
+    )
+
+    def __init__(self, limit=10):
+        self.limit = limit
+
+    def get_queryset(self):
+        return ProductModel.objects.filter(
+            status=ProductStatusType.PUBLISH.value, in_stock=True
+        ).only(*self.fields)
+
+    def serialize(self, product):
+        return {
+            "id": product.id,
+            "slug": product.slug,
+            "name": product.name,
+            "image_url": product.image.url if product.image else None,
+            "price": product.min_price,
+            "final_price": product.min_final_price,
+            "discount_percent": product.min_price_discount_percent,
+        }
+
+    def get_all(self):
+        return [self.serialize(product) for product in self.get_queryset()]
+
+
+class NewestProductsProvider(BaseProductRailProvider):
+    def get_queryset(self):
+        return super().get_queryset().order_by("-created_date")[: self.limit]
+
+
+class BestSellingProductsProvider(BaseProductRailProvider):
+    def __init__(self, limit=10, days=30):
+        super().__init__(limit)
+        self.days = days
+
+    def get_queryset(self):
+        try:
+            ranked = list(
+                BestSellerRanking()
+                .top_products(self.days, self.limit)
+                .only(*self.fields)
+            )
+        except RedisError:
+            ranked = []
+
+        if ranked:
+            return ranked
+        return super().get_queryset().order_by("-total_sold")[: self.limit]
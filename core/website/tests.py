@@ -1,3 +1,127 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import caches
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase, override_settings
+from redis import RedisError
+
+from website.context_processors import layout_processor
+
+TEST_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "layout-tests-shared",
+    },
+    "local": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "layout-tests-local",
+    },
+}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class LayoutProcessorQueryBudgetTests(TestCase):
+    """
+    The layout context is rendered on every page, so once its caches are
+    warm it must not touch the database. The Redis backed pieces (unread
+    counter, recent searches) are stubbed as a warm Redis would answer.
+    """
+
+    def setUp(self):
+        caches["default"].clear()
+        caches["local"].clear()
+        self.factory = RequestFactory()
+        self.user = get_user_model().objects.create_user(
+            phone="09120000000", password="test-password"
+        )
+
+        counter = mock.patch(
+            "notifications.services.unread.UnreadMessageCounter"
+        )
+        self.counter = counter.start()
+        self.counter.return_value.get.return_value = 0
+        self.addCleanup(counter.stop)
+
+        recent = mock.patch(
+            "website.services.layout.provider.RecentSearchStore"
+        )
+        self.recent = recent.start()
+        self.recent.return_value.get.return_value = []
+        self.addCleanup(recent.stop)
+
+    def _request(self, user):
+        request = self.factory.get("/")
+        SessionMiddleware(lambda r: None).process_request(request)
+        request.user = user
+        return request
+
+    def _render(self, user):
+        context = layout_processor(self._request(user))
+        for name, value in context.items():
+            if name == "cart":
+                value.total_quantity()
+            else:
+                bool(value)
+        return context
+
+    def test_anonymous_render_hits_no_queries_when_primed(self):
+        self._render(AnonymousUser())
+
+        with self.assertNumQueries(0):
+            self._render(AnonymousUser())
+
+    def test_signed_in_render_hits_no_queries_when_primed(self):
+        self._render(self.user)
+
+        with self.assertNumQueries(0):
+            self._render(self.user)
+
+    def test_shared_tier_alone_hits_no_queries(self):
+        self._render(AnonymousUser())
+        caches["local"].clear()
+
+        with self.assertNumQueries(0):
+            self._render(self.user)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class LayoutRenderTests(TestCase):
+    """Render base.html itself, so template-level failures are caught."""
+
+    template_name = "bases/base.html"
+
+    def setUp(self):
+        caches["default"].clear()
+        caches["local"].clear()
+        self.factory = RequestFactory()
+        self.user = get_user_model().objects.create_user(
+            phone="09120000001", password="test-password"
+        )
+
+    def _request(self, user):
+        request = self.factory.get("/")
+        SessionMiddleware(lambda r: None).process_request(request)
+        request.user = user
+        return request
+
+    def test_anonymous_render(self):
+        html = render_to_string(
+            self.template_name, request=self._request(AnonymousUser())
+        )
+
+        self.assertIn("</html>", html)
+
+    @mock.patch(
+        "common.services.redis_client.get_redis_connection",
+        side_effect=RedisError,
+    )
+    def test_signed_in_render_when_redis_is_down(self, get_connection):
+        html = render_to_string(
+            self.template_name, request=self._request(self.user)
+        )
+
+        self.assertIn("</html>", html)
+        self.assertTrue(get_connection.called)